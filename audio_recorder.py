@@ -1,26 +1,53 @@
 """
 录音模块 - 支持开始/停止控制的流式录音
 """
+import functools
+import os
 import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 import numpy as np
-import sounddevice as sd
-import scipy.io.wavfile as wav
-import io
-import base64
+import struct
 import webrtcvad
 
+try:
+    # SIMD 加速的 base64 编码，未安装时回退到标准库
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    # Opus 编码（可选，需要系统安装 libopus），用于压缩上传的音频
+    import opuslib
+    OPUS_AVAILABLE = True
+except Exception:
+    OPUS_AVAILABLE = False
+
 
 # 录音参数
 SAMPLE_RATE = 16000  # 采样率
 CHANNELS = 1  # 单声道
 VAD_FRAME_MS = 30  # VAD 帧长度（毫秒），可选 10, 20, 30
 VAD_FRAME_SAMPLES = int(SAMPLE_RATE * VAD_FRAME_MS / 1000)  # 480 samples for 30ms
+VAD_BATCH_FRAMES = 4  # 累积多少帧后批量做一次 VAD 检测（4 帧 = 120ms）
+VAD_ENERGY_THRESHOLD = 100  # 能量预筛阈值（int16 RMS，约 -50 dBFS），低于此值的帧直接视为静音
+# 归一化到 [-1, 1) 后的单帧能量阈值
+_VAD_ENERGY_THRESHOLD_F32 = (VAD_ENERGY_THRESHOLD / 32768.0) ** 2 * VAD_FRAME_SAMPLES
+# 过零率预筛：过零率极高（接近白噪声）且能量不足阈值 4 倍的帧视为底噪，同样跳过 VAD
+VAD_NOISE_ZCR = 0.5
+
+# 所有录音器共用的自动停止回调线程，避免每次自动停止都新建线程
+_AUTO_STOP_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recorder-autostop")
 
 
 class AudioRecorder:
-    """支持开始/停止控制的录音器"""
+    """支持开始/停止控制的录音器
+
+    音频回调只负责把数据写入预分配缓冲区并推进写指针；
+    VAD 检测、流式转发和自动停止判断都在工作线程中完成，避免阻塞实时音频线程。
+    """
 
     def __init__(self, sample_rate: int = SAMPLE_RATE, channels: int = CHANNELS,
                  device_id: Optional[int] = None):
@@ -34,26 +61,35 @@ class AudioRecorder:
         self.channels = channels
         self.device_id = device_id
 
-        self._recording = False
-        self._audio_chunks = []
+        # 状态标志使用 Event：音频回调只做无锁读取，写入方在 _lock 内修改
+        self._recording_evt = threading.Event()  # 是否正在录音
+        self._auto_stop_evt = threading.Event()  # 是否已停止写入（自动停止或手动停止）
+        self._audio_buf = np.empty((0, channels), dtype=np.int16)  # 预分配的录音缓冲区
+        self._audio_pos = 0  # 已写入的采样点数（仅音频回调写入）
+        self._spare_buf: Optional[np.ndarray] = None  # 上次录音归还的缓冲区，下次 start() 复用
         self._stream = None
         self._lock = threading.Lock()
 
+        # 工作线程（单生产者：音频回调；单消费者：工作线程）
+        self._worker: Optional[threading.Thread] = None
+        self._data_ready = threading.Event()  # 音频回调写入新数据后唤醒工作线程
+        self._worker_exit = False  # 音频流关闭后由 stop() 置位，通知工作线程收尾退出
+
         # VAD 相关
-        self._vad = webrtcvad.Vad(3)  # 敏感度 0-3，3 最敏感
-        self._vad_buffer = np.array([], dtype=np.int16)  # 用于累积音频数据
+        self._vad = _get_vad(3)  # 敏感度 0-3，3 最敏感
+        self._vad_scratch = np.empty((VAD_BATCH_FRAMES, VAD_FRAME_SAMPLES), dtype=np.float32)  # 能量预筛用的复用缓冲
 
         # 音频流回调（用于流式识别）
-        self._on_audio_chunk: Optional[Callable[[bytes], None]] = None
+        self._on_audio_chunk: Optional[Callable[[memoryview], None]] = None
 
         # 自动停止相关属性
+        # 超时判断以已录制的采样点数为时钟，与音频时间轴一致且无需每次取系统时间
         self._start_time: float = 0
-        self._last_voice_time: float = 0
+        self._last_voice_sample: int = 0  # 最近一次检测到语音时的采样点位置
         self._max_duration: int = 60
         self._silence_timeout: int = 3
         self._auto_stop_callback: Optional[Callable[[str], None]] = None
         self._auto_stop_reason: Optional[str] = None
-        self._auto_stopped: bool = False
 
     def set_device(self, device_id: Optional[int]):
         """设置录音设备"""
@@ -62,40 +98,55 @@ class AudioRecorder:
 
     def start(self, max_duration: int = 60, silence_timeout: int = 3,
                on_auto_stop: Optional[Callable[[str], None]] = None,
-               on_audio_chunk: Optional[Callable[[bytes], None]] = None):
+               on_audio_chunk: Optional[Callable[[memoryview], None]] = None):
         """开始录音
 
         Args:
             max_duration: 最长录音时长（秒）
             silence_timeout: 静音超时时间（秒）
             on_auto_stop: 自动停止时的回调函数，参数为停止原因 ('timeout' / 'silence')
-            on_audio_chunk: 音频数据回调（PCM int16 bytes），用于流式识别
+            on_audio_chunk: 音频数据回调（PCM int16 字节视图，零拷贝指向录音缓冲区），用于流式识别
         """
         with self._lock:
-            if self._recording:
+            if self._recording_evt.is_set():
                 return
 
-            self._audio_chunks = []
-            self._vad_buffer = np.array([], dtype=np.int16)
-            self._recording = True
+            # 按最长录音时长预分配缓冲区（多留 1 秒余量，自动停止生效前仍可能有回调写入）；
+            # 上次录音归还的缓冲区容量足够时直接复用，避免每次重新分配和缺页
+            capacity = self.sample_rate * (max_duration + 1)
+            spare = self._spare_buf
+            self._spare_buf = None
+            if spare is not None and len(spare) >= capacity:
+                self._audio_buf = spare
+            else:
+                self._audio_buf = np.empty((capacity, self.channels), dtype=np.int16)
+            self._audio_pos = 0
+            self._data_ready.clear()
+            self._worker_exit = False
+            self._auto_stop_evt.clear()
+            self._recording_evt.set()
 
             # 初始化自动停止相关属性
             self._start_time = time.time()
-            self._last_voice_time = time.time()
+            self._last_voice_sample = 0
             self._max_duration = max_duration
             self._silence_timeout = silence_timeout
             self._auto_stop_callback = on_auto_stop
             self._on_audio_chunk = on_audio_chunk
             self._auto_stop_reason = None
-            self._auto_stopped = False
 
             try:
+                # 延迟导入：加载 PortAudio 较慢，首次录音时才需要
+                import sounddevice as sd
                 # 创建输入流
                 self._stream = sd.InputStream(
                     device=self.device_id,
                     samplerate=self.sample_rate,
                     channels=self.channels,
                     dtype=np.int16,
+                    # 固定每次回调一帧 VAD 长度，回调开销恒定且与 VAD 帧对齐
+                    blocksize=VAD_FRAME_SAMPLES,
+                    latency="low",
                     callback=self._audio_callback
                 )
                 self._stream.start()
@@ -107,17 +158,23 @@ class AudioRecorder:
                     except Exception:
                         pass
                 self._stream = None
-                self._recording = False
-                self._audio_chunks = []
-                self._vad_buffer = np.array([], dtype=np.int16)
+                self._recording_evt.clear()
+                self._audio_buf = np.empty((0, self.channels), dtype=np.int16)
+                self._audio_pos = 0
                 self._auto_stop_callback = None
                 self._on_audio_chunk = None
                 self._auto_stop_reason = None
-                self._auto_stopped = False
                 self._start_time = 0
-                self._last_voice_time = 0
+                self._last_voice_sample = 0
                 raise
 
+            self._worker = threading.Thread(
+                target=self._process_loop,
+                args=(on_audio_chunk,),
+                daemon=True
+            )
+            self._worker.start()
+
     def stop(self) -> np.ndarray:
         """
         停止录音并返回录制的音频数据
@@ -126,16 +183,18 @@ class AudioRecorder:
             录制的音频数据 (numpy array)
         """
         with self._lock:
-            if not self._recording:
+            if not self._recording_evt.is_set():
                 return np.array([], dtype=np.int16)
 
             # 先设置标志，阻止 _audio_callback 继续写入
-            self._recording = False
-            self._auto_stopped = True
+            self._auto_stop_evt.set()
+            self._recording_evt.clear()
             stream = self._stream
             self._stream = None
             self._on_audio_chunk = None
             self._auto_stop_callback = None
+            worker = self._worker
+            self._worker = None
 
         # 在锁外关闭音频流，避免和回调线程争锁造成阻塞
         if stream:
@@ -148,92 +207,149 @@ class AudioRecorder:
             except Exception:
                 pass
 
-        with self._lock:
-            # 合并所有音频块
-            if self._audio_chunks:
-                audio_data = np.concatenate(self._audio_chunks)
-            else:
-                audio_data = np.array([], dtype=np.int16)
+        # 音频流已关闭，通知工作线程转发剩余数据后退出
+        self._worker_exit = True
+        self._data_ready.set()
+        if worker and worker is not threading.current_thread():
+            worker.join(timeout=1.0)
 
-            self._audio_chunks = []
-            self._vad_buffer = np.array([], dtype=np.int16)
+        with self._lock:
+            # 截取已写入部分：录音较长时直接把视图交给调用方（缓冲区归调用方所有，不再复用）；
+            # 录音远短于容量时复制一份返回，缓冲区留给下次 start() 复用
+            audio_data = self._audio_buf[:self._audio_pos]
+            if self._audio_pos * 2 < len(self._audio_buf):
+                audio_data = audio_data.copy()
+                self._spare_buf = self._audio_buf
+
+            self._audio_buf = np.empty((0, self.channels), dtype=np.int16)
+            self._audio_pos = 0
             return audio_data
 
     def is_recording(self) -> bool:
         """检查是否正在录音"""
-        with self._lock:
-            return self._recording
+        return self._recording_evt.is_set()
 
     def _audio_callback(self, indata, frames, time_info, status):
-        """音频流回调函数"""
-        on_audio_chunk = None
-        pcm_bytes = b""
-        auto_stop_reason = None
+        """音频流回调函数（实时线程，只写缓冲区，不加锁、不做耗时处理）"""
+        if self._auto_stop_evt.is_set() or not self._recording_evt.is_set():
+            return
+
+        # 直接拷贝进预分配缓冲区（indata 只在回调期间有效，但无需 indata.copy() 另行分配），
+        # 超出容量的部分丢弃（此时最长时长检测会触发停止）
+        pos = self._audio_pos
+        end = pos + frames
+        if end <= len(self._audio_buf):
+            np.copyto(self._audio_buf[pos:end], indata)
+        else:
+            end = len(self._audio_buf)
+            np.copyto(self._audio_buf[pos:end], indata[:end - pos])
+        self._audio_pos = end
+        # 工作线程尚未被唤醒时才 set()，避免每次回调都去竞争 Event 内部的锁
+        if not self._data_ready.is_set():
+            self._data_ready.set()
+
+    def _process_loop(self, on_audio_chunk: Optional[Callable[[memoryview], None]]):
+        """工作线程：转发流式音频、VAD 检测、自动停止判断"""
+        audio_buf = self._audio_buf
+        read_pos = 0  # 已转发给 on_audio_chunk 的位置
+        vad_pos = 0  # 已完成 VAD 检测的位置
+        max_samples = self._max_duration * self.sample_rate
+        silence_samples = self._silence_timeout * self.sample_rate
+
+        while True:
+            self._data_ready.wait(timeout=0.1)
+            self._data_ready.clear()
+            # 先读退出标志再读写指针，保证退出前能看到全部已写入数据
+            exiting = self._worker_exit
+            end = self._audio_pos
+
+            # 流式回调：转发新写入的 PCM 数据
+            if end > read_pos:
+                if on_audio_chunk:
+                    try:
+                        # 直接传递缓冲区的字节视图，避免每次分配新的 bytes
+                        on_audio_chunk(memoryview(audio_buf[read_pos:end]).cast('B'))
+                    except Exception:
+                        pass
+                read_pos = end
 
-        with self._lock:
-            if not self._recording or self._auto_stopped:
+            if exiting:
                 return
+            if self._auto_stop_evt.is_set():
+                continue
 
-            chunk_copy = indata.copy()
-            self._audio_chunks.append(chunk_copy)
-            on_audio_chunk = self._on_audio_chunk
-
-            chunk = chunk_copy.flatten()
-            pcm_bytes = chunk.tobytes()
-            self._vad_buffer = np.concatenate([self._vad_buffer, chunk])
-
-            current_time = time.time()
-
-            # 按帧处理 VAD 检测
-            while len(self._vad_buffer) >= VAD_FRAME_SAMPLES:
-                frame = self._vad_buffer[:VAD_FRAME_SAMPLES]
-                self._vad_buffer = self._vad_buffer[VAD_FRAME_SAMPLES:]
-
-                # 转换为 bytes 进行 VAD 检测
-                frame_bytes = frame.tobytes()
-                try:
-                    if self._vad.is_speech(frame_bytes, self.sample_rate):
-                        self._last_voice_time = current_time
-                except Exception:
-                    # VAD 检测失败时忽略
-                    pass
+            # 攒够一批帧后再做 VAD 检测（只检测第一个声道）
+            n_frames = (end - vad_pos) // VAD_FRAME_SAMPLES
+            if n_frames >= VAD_BATCH_FRAMES:
+                batch_start = vad_pos
+                vad_pos += n_frames * VAD_FRAME_SAMPLES
+                if self._batch_has_speech(audio_buf, batch_start, n_frames):
+                    self._last_voice_sample = vad_pos
 
             # 检查是否超过最大时长
-            if current_time - self._start_time >= self._max_duration:
-                auto_stop_reason = 'timeout'
+            if end >= max_samples:
+                self._trigger_auto_stop('timeout')
             # 检查静音是否超时
-            elif current_time - self._last_voice_time >= self._silence_timeout:
-                auto_stop_reason = 'silence'
+            elif end - self._last_voice_sample >= silence_samples:
+                self._trigger_auto_stop('silence')
 
-        # 流式回调：转发 PCM 数据（锁外执行，避免阻塞录音状态更新）
-        if on_audio_chunk:
+    def _batch_has_speech(self, audio_buf: np.ndarray, start: int, n_frames: int) -> bool:
+        """检测一批连续帧中是否有语音
+
+        同一批帧共用一个时间点，只需知道是否有语音即可，
+        因此从最新的帧往回检测，命中即返回，讲话期间每批通常只需一次 VAD 调用。
+        调用 VAD 前先用向量化的能量预筛跳过明显静音的帧。
+        """
+        samples = audio_buf[start:start + n_frames * VAD_FRAME_SAMPLES, 0]
+        frames = samples.reshape(n_frames, VAD_FRAME_SAMPLES)
+
+        # 整批一次性归一化到复用的 float32 缓冲区，避免逐帧转换和 int64 临时数组
+        if len(self._vad_scratch) < n_frames:
+            self._vad_scratch = np.empty((n_frames, VAD_FRAME_SAMPLES), dtype=np.float32)
+        scaled = self._vad_scratch[:n_frames]
+        np.multiply(frames, 1.0 / 32768.0, out=scaled)
+        energy = np.einsum('ij,ij->i', scaled, scaled)
+        candidates = energy >= _VAD_ENERGY_THRESHOLD_F32
+
+        # 只对能量接近阈值的候选帧计算过零率，过滤掉嘶嘶声一类的底噪
+        weak = candidates & (energy < _VAD_ENERGY_THRESHOLD_F32 * 4)
+        if weak.any():
+            signs = np.signbit(scaled[weak])
+            zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (VAD_FRAME_SAMPLES - 1)
+            candidates[np.flatnonzero(weak)[zcr > VAD_NOISE_ZCR]] = False
+
+        for i in range(n_frames - 1, -1, -1):
+            if not candidates[i]:
+                continue
+            offset = start + i * VAD_FRAME_SAMPLES
+            frame = audio_buf[offset:offset + VAD_FRAME_SAMPLES, 0]
             try:
-                on_audio_chunk(pcm_bytes)
+                if self._vad.is_speech(frame.tobytes(), self.sample_rate):
+                    return True
             except Exception:
+                # VAD 检测失败时忽略
                 pass
-
-        if auto_stop_reason:
-            self._trigger_auto_stop(auto_stop_reason)
+        return False
 
     def _trigger_auto_stop(self, reason: str):
         """触发自动停止"""
         with self._lock:
             # 双重检查：如果已经停止或不在录音状态，直接返回
-            if self._auto_stopped or not self._recording:
+            if self._auto_stop_evt.is_set() or not self._recording_evt.is_set():
                 return
 
-            self._auto_stopped = True
+            self._auto_stop_evt.set()
             self._auto_stop_reason = reason
             callback = self._auto_stop_callback
 
-        # 在新线程中调用回调，避免阻塞音频回调
+        # 交给共享线程执行回调，避免阻塞工作线程
         if callback:
-            threading.Thread(target=callback, args=(reason,), daemon=True).start()
+            _AUTO_STOP_POOL.submit(callback, reason)
 
     def get_recording_duration(self) -> float:
         """获取当前录音时长（秒）"""
         with self._lock:
-            if not self._recording:
+            if not self._recording_evt.is_set():
                 return 0
             start_time = self._start_time
         return time.time() - start_time
@@ -244,6 +360,60 @@ class AudioRecorder:
             return self._auto_stop_reason
 
 
+@functools.lru_cache(maxsize=None)
+def _get_vad(mode: int) -> "webrtcvad.Vad":
+    """按敏感度缓存 webrtcvad.Vad 实例，多个录音器共用"""
+    return webrtcvad.Vad(mode)
+
+
+# WAV 文件头结构：RIFF + fmt + data，共 44 字节
+_WAV_HEADER_STRUCT = struct.Struct("<4sI4s4sIHHIIHH4sI")
+_WAV_SIZE_FIELD = struct.Struct("<I")
+
+
+@functools.lru_cache(maxsize=None)
+def _wav_header_template(sample_rate: int, channels: int, bits_per_sample: int) -> bytes:
+    """按 (采样率, 声道数, 位深) 缓存的 WAV 头模板，长度字段留空"""
+    block_align = channels * bits_per_sample // 8
+    return _WAV_HEADER_STRUCT.pack(
+        b"RIFF", 36, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align,
+        block_align, bits_per_sample,
+        b"data", 0
+    )
+
+
+def _build_wav_header(data_size: int, sample_rate: int, channels: int = 1,
+                      bits_per_sample: int = 16) -> bytes:
+    """构建 PCM WAV 文件头（基于缓存模板，只填写两个长度字段）"""
+    header = bytearray(_wav_header_template(sample_rate, channels, bits_per_sample))
+    _WAV_SIZE_FIELD.pack_into(header, 4, 36 + data_size)
+    _WAV_SIZE_FIELD.pack_into(header, 40, data_size)
+    return bytes(header)
+
+
+def _encode_wav_base64(audio_data: np.ndarray, sample_rate: int, prefix: bytes = b"") -> str:
+    """把音频编码为 base64 WAV，结果前拼接 prefix（一次拼接完成，不额外复制整段字符串）"""
+    if len(audio_data) == 0:
+        return ""
+
+    # 只输出单声道 16 位 PCM；确保是一维 int16 数组
+    # reshape 在数据连续时返回视图（录音器返回的 (N, 1) 数组即是如此），flatten 则总会复制
+    audio_data = np.ascontiguousarray(audio_data, dtype=np.int16).reshape(-1)
+
+    # 手工拼接 44 字节 WAV 头，PCM 数据直接送入 base64 编码，省去内存 WAV 文件的往返拷贝
+    pcm = memoryview(audio_data).cast('B')
+    header = _build_wav_header(len(pcm), sample_rate)
+
+    # base64 以 3 字节为一组：从 PCM 借几个字节把头部补齐到 3 的倍数，
+    # 两段分别编码后直接拼接结果，避免先拼出 header + PCM 的完整副本
+    split = -len(header) % 3
+    head_b64 = base64.b64encode(header + pcm[:split].tobytes())
+    body_b64 = base64.b64encode(pcm[split:])
+
+    return b"".join((prefix, head_b64, body_b64)).decode('ascii')
+
+
 def audio_to_base64(audio_data: np.ndarray, sample_rate: int = SAMPLE_RATE) -> str:
     """
     将音频数据转换为 base64 编码的 WAV 格式
@@ -255,21 +425,136 @@ def audio_to_base64(audio_data: np.ndarray, sample_rate: int = SAMPLE_RATE) -> s
     Returns:
         base64 编码的音频字符串
     """
-    if len(audio_data) == 0:
-        return ""
+    return _encode_wav_base64(audio_data, sample_rate)
+
+
+def audio_to_data_url(audio_data: np.ndarray, sample_rate: int = SAMPLE_RATE) -> str:
+    """
+    将音频数据转换为 data:audio/wav;base64,... 形式的 data URL
+
+    Args:
+        audio_data: 音频数据
+        sample_rate: 采样率
+
+    Returns:
+        data URL 字符串，音频为空时返回空字符串
+    """
+    return _encode_wav_base64(audio_data, sample_rate, prefix=b"data:audio/wav;base64,")
+
+
+# Opus 编码参数
+OPUS_FRAME_MS = 20  # 每帧时长（毫秒）
+OPUS_BITRATE = 24000  # 码率（bps），语音识别足够
+OPUS_PRE_SKIP = 312  # 解码时丢弃的起始样本数（48kHz），对应 libopus 默认前瞻
+_OPUS_VENDOR = b"voice_input"
+
+# Ogg 页头：capture_pattern, version, header_type, granule, serial, page_seq, crc, segments
+_OGG_PAGE_HEADER = struct.Struct("<4sBBqIIIB")
+_OGG_CRC_FIELD = struct.Struct("<I")
+_OGG_CRC_OFFSET = 22
+
+
+# 字节位反转表：Ogg 页 CRC 与 zlib.crc32 多项式相同（0x04C11DB7），但不做位反转、初值和结果异或均为 0，
+# 把输入逐字节位反转后交给 zlib.crc32（C 实现），再把结果位反转即可得到 Ogg CRC
+_BIT_REVERSE_TABLE = bytes(int(f"{i:08b}"[::-1], 2) for i in range(256))
+
+
+def _ogg_crc(data: bytes) -> int:
+    """计算 Ogg 页 CRC"""
+    crc = zlib.crc32(data.translate(_BIT_REVERSE_TABLE), 0xFFFFFFFF) ^ 0xFFFFFFFF
+    return int(f"{crc:032b}"[::-1], 2)
 
-    # 确保是一维数组
-    if audio_data.ndim > 1:
-        audio_data = audio_data.flatten()
 
-    # 将音频数据写入内存中的 WAV 文件
-    buffer = io.BytesIO()
-    wav.write(buffer, sample_rate, audio_data)
-    buffer.seek(0)
+def _ogg_page(packets: list, granule: int, serial: int, seq: int, header_type: int) -> bytes:
+    """把若干个完整数据包封装成一个 Ogg 页"""
+    lacing = bytearray()
+    for packet in packets:
+        lacing.extend(b"\xff" * (len(packet) // 255))
+        lacing.append(len(packet) % 255)
+    header = _OGG_PAGE_HEADER.pack(b"OggS", 0, header_type, granule, serial, seq, 0, len(lacing))
+    page = bytearray(header)
+    page += lacing
+    for packet in packets:
+        page += packet
+    _OGG_CRC_FIELD.pack_into(page, _OGG_CRC_OFFSET, _ogg_crc(page))
+    return bytes(page)
 
-    # 转换为 base64
-    audio_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-    return audio_base64
+
+def encode_ogg_opus(audio_data: np.ndarray, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """
+    将单声道 int16 音频编码为 Ogg Opus
+
+    Args:
+        audio_data: 音频数据
+        sample_rate: 采样率（须为 8000/12000/16000/24000/48000）
+
+    Returns:
+        Ogg Opus 文件内容
+    """
+    if not OPUS_AVAILABLE:
+        raise RuntimeError("未安装 opuslib")
+
+    pcm = np.ascontiguousarray(audio_data, dtype=np.int16).reshape(-1)
+    scale = 48000 // sample_rate
+    frame_size = sample_rate * OPUS_FRAME_MS // 1000
+
+    # 末尾补零：补足最后一帧，并多留出编码器前瞻的长度，保证尾音完整输出
+    total = len(pcm) + OPUS_PRE_SKIP // scale
+    n_frames = -(-total // frame_size)
+    padded = np.zeros(n_frames * frame_size, dtype=np.int16)
+    padded[:len(pcm)] = pcm
+
+    encoder = opuslib.Encoder(sample_rate, CHANNELS, opuslib.APPLICATION_VOIP)
+    encoder.bitrate = OPUS_BITRATE
+
+    serial = int.from_bytes(os.urandom(4), "little")
+    opus_head = struct.pack("<8sBBHIhB", b"OpusHead", 1, CHANNELS, OPUS_PRE_SKIP, sample_rate, 0, 0)
+    opus_tags = b"OpusTags" + struct.pack("<I", len(_OPUS_VENDOR)) + _OPUS_VENDOR + struct.pack("<I", 0)
+    pages = [
+        _ogg_page([opus_head], 0, serial, 0, 0x02),  # 首页（BOS）
+        _ogg_page([opus_tags], 0, serial, 1, 0),
+    ]
+
+    # 结束位置：真实音频之后的样本在解码端被裁掉
+    end_granule = OPUS_PRE_SKIP + len(pcm) * scale
+    frame_granule = frame_size * scale
+    pcm_bytes = memoryview(padded).cast('B')
+    frame_bytes = frame_size * 2
+
+    page_packets = []
+    page_segments = 0
+    for i in range(n_frames):
+        packet = encoder.encode(pcm_bytes[i * frame_bytes:(i + 1) * frame_bytes].tobytes(), frame_size)
+        segments = len(packet) // 255 + 1
+        if page_segments + segments > 255:
+            pages.append(_ogg_page(page_packets, i * frame_granule, serial, len(pages), 0))
+            page_packets = []
+            page_segments = 0
+        page_packets.append(packet)
+        page_segments += segments
+
+    last_granule = min(n_frames * frame_granule, end_granule)
+    pages.append(_ogg_page(page_packets, last_granule, serial, len(pages), 0x04))  # 末页（EOS）
+    return b"".join(pages)
+
+
+def audio_to_opus_data_url(audio_data: np.ndarray, sample_rate: int = SAMPLE_RATE) -> str:
+    """
+    将音频数据编码为 Ogg Opus，并转换为 data:audio/ogg;base64,... 形式的 data URL
+
+    体积约为 16kHz WAV 的十分之一，适合网络较慢时上传。
+
+    Args:
+        audio_data: 音频数据
+        sample_rate: 采样率
+
+    Returns:
+        data URL 字符串，音频为空时返回空字符串
+    """
+    if len(audio_data) == 0:
+        return ""
+    ogg = encode_ogg_opus(audio_data, sample_rate)
+    return b"".join((b"data:audio/ogg;base64,", base64.b64encode(ogg))).decode('ascii')
 
 
 if __name__ == "__main__":
@@ -2,21 +2,103 @@
 配置管理模块 - 管理语音输入应用的配置
 """
 import os
+import re
+import copy
 import json
-from datetime import datetime
+import atexit
+import threading
+from datetime import datetime, timedelta
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
-import glob as glob_module
+from typing import Optional, Dict, Any, List, Union, BinaryIO, Tuple
+
+try:
+    import orjson
+
+    def _dump_line(item: Dict) -> bytes:
+        """序列化一条历史记录为 JSONL 行"""
+        return orjson.dumps(item) + b"\n"
+
+    _load_line = orjson.loads
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_line(item: Dict) -> bytes:
+        """序列化一条历史记录为 JSONL 行"""
+        return (json.dumps(item, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _load_line = json.loads
+    _load_json = json.loads
+
+
+# 历史记录追加写入的缓冲区大小
+HISTORY_WRITE_BUFFER_SIZE = 64 * 1024
+# 延迟落盘的等待时间（秒）：期间的追加写入和统计更新会合并为一次
+HISTORY_FLUSH_DELAY = 2.0
+# 月份文件中编辑/删除记录占比超过该值时压缩重写
+HISTORY_COMPACT_RATIO = 0.3
+# 倒序读取历史文件时每次读取的块大小
+HISTORY_READ_BLOCK_SIZE = 64 * 1024
+# 月份历史文件名格式：YYYY-MM.jsonl
+_MONTH_FILE_RE = re.compile(r"\A\d{4}-\d{2}\.jsonl\Z")
+# 配置延迟保存的等待时间（秒）：期间的多次修改合并为一次写入
+CONFIG_SAVE_DELAY = 0.2
+
+# LLM 提供商对应的接口地址，未知提供商使用 DEFAULT_LLM_BASE_URL
+LLM_BASE_URLS = {
+    "deepseek": "https://api.deepseek.com",
+}
+DEFAULT_LLM_BASE_URL = "https://api.deepseek.com"
+
+
+def _atomic_write_json(path: Path, obj: Any):
+    """原子写入 JSON 文件
+
+    先写入同目录的临时文件并 fsync，再用 os.replace 替换目标文件，
+    进程崩溃或断电时不会留下写了一半的文件。
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
 
 
 class HistoryManager:
-    """历史消息管理器 - 独立于配置的历史存储"""
+    """历史消息管理器 - 独立于配置的历史存储
+
+    新消息和统计增量先写入内存缓冲，最多 HISTORY_FLUSH_DELAY 秒后落盘；
+    正常退出时由退出回调和 atexit 落盘，进程崩溃或被强制结束时最近这段时间内的记录会丢失。
+    """
 
     def __init__(self):
         self.history_dir = Path.home() / ".voice_input" / "history"
         self.stats_file = self.history_dir / "stats.json"
         self._ensure_dir()
 
+        # 按文件名缓存的追加写入句柄（带缓冲，延迟落盘）
+        self._append_handles: Dict[str, BinaryIO] = {}
+        # 尚未写入 stats.json 的统计增量
+        self._pending_chars = 0
+        self._pending_count = 0
+        # stats.json 内容的内存缓存（本类是该文件唯一的写入者）
+        self._stats: Optional[Dict] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        self._recalculating = False
+        # 历史文件被重写或清空时递增，后台重新计算据此判断扫描结果是否作废
+        self._files_generation = 0
+        # 月份文件列表缓存，目录 mtime 变化或本进程新建/删除文件时失效
+        self._month_files_cache: Optional[List[Path]] = None
+        self._month_files_mtime = 0
+        # 按文件名缓存的时间戳索引，首次编辑/删除该月消息时构建
+        self._month_index: Dict[str, Dict] = {}
+        atexit.register(self.close)
+
+        # stats.json 缺失时在后台重建，不阻塞调用方
+        if not self.stats_file.exists():
+            self._start_recalculate()
+
     def _ensure_dir(self):
         """确保历史目录存在"""
         self.history_dir.mkdir(parents=True, exist_ok=True)
@@ -28,47 +110,248 @@ class HistoryManager:
         return self.history_dir / f"{month}.jsonl"
 
     def _append_to_file(self, filename: str, item: Dict):
-        """追加一条记录到文件"""
-        filepath = self.history_dir / filename
-        with open(filepath, "a", encoding="utf-8") as f:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+        """追加一条记录到文件（写入缓存的句柄，稍后统一落盘）"""
+        with self._lock:
+            f = self._append_handles.get(filename)
+            if f is None:
+                filepath = self.history_dir / filename
+                if not filepath.exists():
+                    self._month_files_cache = None
+                f = open(filepath, "ab",
+                         buffering=HISTORY_WRITE_BUFFER_SIZE)
+                self._append_handles[filename] = f
+            f.write(_dump_line(item))
+            index = self._month_index.get(filename)
+            if index is not None:
+                self._index_record(index, item)
+        self._schedule_flush()
+
+    def _close_append_handle(self, filename: str):
+        """关闭指定文件的追加句柄（重写或删除文件前调用）"""
+        with self._lock:
+            f = self._append_handles.pop(filename, None)
+            if f is not None:
+                f.close()
+
+    def _schedule_flush(self):
+        """安排一次延迟落盘，期间的多次写入合并处理"""
+        with self._lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(HISTORY_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """将缓冲的历史记录和统计增量写入磁盘"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            for f in self._append_handles.values():
+                f.flush()
+            # 后台重新计算期间增量保留在内存，由重新计算完成时合并
+            if (self._pending_chars or self._pending_count) and not self._recalculating:
+                stats = self._load_stats()
+                stats["total_chars"] = max(0, stats.get("total_chars", 0) + self._pending_chars)
+                stats["total_count"] = max(0, stats.get("total_count", 0) + self._pending_count)
+                stats["updated_at"] = datetime.now().isoformat()
+                self._pending_chars = 0
+                self._pending_count = 0
+                self._save_stats(stats)
+
+    def close(self):
+        """落盘并关闭所有追加句柄（进程退出时自动调用）"""
+        with self._lock:
+            self.flush()
+            for f in self._append_handles.values():
+                f.close()
+            self._append_handles.clear()
 
     def _read_file(self, filepath: Path) -> List[Dict]:
-        """读取文件所有记录"""
+        """读取文件中的所有有效消息（已应用编辑/删除记录）"""
+        items, _ = self._fold_records(self._read_records(filepath))
+        return items
+
+    @staticmethod
+    def _fold_records(records: List[Dict]) -> Tuple[List[Dict], int]:
+        """将编辑/删除记录折叠到原始消息上
+
+        文件中除消息外还可能有 {"op": "upd"/"del", "timestamp": ...} 记录，
+        作用于它之前同一时间戳的所有消息（与 get_recent 倒序读取时的规则一致）。
+
+        Returns:
+            (有效消息列表, 编辑/删除记录条数)
+        """
+        items: List[Optional[Dict]] = []
+        positions: Dict[str, List[int]] = {}
+        op_count = 0
+        for record in records:
+            op = record.get("op")
+            timestamp = record.get("timestamp")
+            if op is None:
+                positions.setdefault(timestamp, []).append(len(items))
+                items.append(record)
+                continue
+
+            op_count += 1
+            matched = positions.get(timestamp)
+            if not matched:
+                continue
+            if op == "upd":
+                for index in matched:
+                    item = items[index]
+                    item["text"] = record.get("text", "")
+                    if "status" in record:
+                        item["status"] = record["status"]
+            elif op == "del":
+                for index in matched:
+                    items[index] = None
+                del positions[timestamp]
+
+        return [item for item in items if item is not None], op_count
+
+    def _get_month_index(self, filepath: Path) -> Dict:
+        """获取月份文件的时间戳索引（首次访问时读取文件构建）
+
+        索引结构：{"texts": {时间戳: [有效消息的字数, ...]}, "items": 有效消息数, "ops": 编辑/删除记录数}
+        """
+        with self._lock:
+            index = self._month_index.get(filepath.name)
+            if index is None:
+                index = {"texts": {}, "items": 0, "ops": 0}
+                for record in self._read_records(filepath):
+                    self._index_record(index, record)
+                self._month_index[filepath.name] = index
+            return index
+
+    @staticmethod
+    def _index_record(index: Dict, record: Dict):
+        """将一条记录计入索引（规则与 _fold_records 一致）"""
+        timestamp = record.get("timestamp")
+        op = record.get("op")
+        if op is None:
+            index["texts"].setdefault(timestamp, []).append(len(record.get("text", "")))
+            index["items"] += 1
+            return
+
+        index["ops"] += 1
+        lengths = index["texts"].get(timestamp)
+        if not lengths:
+            return
+        if op == "upd":
+            lengths[:] = [len(record.get("text", ""))] * len(lengths)
+        elif op == "del":
+            index["items"] -= len(lengths)
+            del index["texts"][timestamp]
+
+    def _compact_if_needed(self, filepath: Path, item_count: int, op_count: int):
+        """编辑/删除记录占比过高时，重写文件只保留有效消息"""
+        total = item_count + op_count
+        if total and op_count / total > HISTORY_COMPACT_RATIO:
+            self._write_file(filepath, self._read_file(filepath))
+
+    def _read_records(self, filepath: Path, max_bytes: Optional[int] = None) -> List[Dict]:
+        """读取文件中的所有原始记录（含编辑/删除记录）
+
+        Args:
+            filepath: 月份文件路径
+            max_bytes: 只读取文件开头的这些字节（之后追加的记录不读），为 None 时读取整个文件
+        """
+        # 先把缓冲中的追加内容写入文件，保证读到最新数据
+        with self._lock:
+            f = self._append_handles.get(filepath.name)
+            if f is not None:
+                f.flush()
         if not filepath.exists():
             return []
         items = []
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
+        with open(filepath, "rb") as f:
+            lines = f if max_bytes is None else f.read(max_bytes).splitlines()
+            for line in lines:
                 line = line.strip()
                 if line:
                     try:
-                        items.append(json.loads(line))
+                        items.append(_load_line(line))
                     except json.JSONDecodeError:
                         continue
         return items
 
+    def _iter_lines_reverse(self, filepath: Path, block: int = HISTORY_READ_BLOCK_SIZE):
+        """从文件末尾开始逐行倒序读取（按块读取，不加载整个文件）"""
+        # 先把缓冲中的追加内容写入文件，保证读到最新数据
+        with self._lock:
+            f = self._append_handles.get(filepath.name)
+            if f is not None:
+                f.flush()
+        try:
+            fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except FileNotFoundError:
+            return
+        try:
+            pos = os.lseek(fd, 0, os.SEEK_END)
+            tail = b""
+            while pos > 0:
+                size = min(block, pos)
+                pos -= size
+                os.lseek(fd, pos, os.SEEK_SET)
+                chunk = os.read(fd, size) + tail
+                # 块首的不完整行留到下一轮与前一块拼接
+                end = len(chunk)
+                idx = chunk.rfind(b"\n", 0, end)
+                while idx >= 0:
+                    line = chunk[idx + 1:end].strip()
+                    if line:
+                        yield line
+                    end = idx
+                    idx = chunk.rfind(b"\n", 0, end)
+                tail = chunk[:end]
+            tail = tail.strip()
+            if tail:
+                yield tail
+        finally:
+            os.close(fd)
+
     def _write_file(self, filepath: Path, items: List[Dict]):
         """重写整个文件"""
-        with open(filepath, "w", encoding="utf-8") as f:
+        # 追加句柄的写入位置在部分平台上不会随截断更新，重写前先关闭
+        self._close_append_handle(filepath.name)
+        index = {"texts": {}, "items": 0, "ops": 0}
+        with open(filepath, "wb") as f:
             for item in items:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.write(_dump_line(item))
+                self._index_record(index, item)
+        with self._lock:
+            self._month_index[filepath.name] = index
+            self._files_generation += 1
 
     def _get_all_month_files(self) -> List[Path]:
-        """获取所有月份文件，按月份降序排列"""
-        pattern = str(self.history_dir / "*.jsonl")
-        files = glob_module.glob(pattern)
-        # 过滤掉非月份格式的文件
-        month_files = []
-        for f in files:
-            name = Path(f).stem
-            # 检查是否为 YYYY-MM 格式
-            if len(name) == 7 and name[4] == "-":
-                month_files.append(Path(f))
-        # 按文件名降序排列（最新的月份在前）
-        month_files.sort(key=lambda x: x.stem, reverse=True)
+        """获取所有月份文件，按月份降序排列（带缓存）"""
+        try:
+            mtime = self.history_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        cached = self._month_files_cache
+        if cached is not None and mtime == self._month_files_mtime:
+            return cached
+        month_files = self._scan_month_files()
+        self._month_files_cache = month_files
+        self._month_files_mtime = mtime
         return month_files
 
+    def _scan_month_files(self) -> List[Path]:
+        """扫描历史目录中的月份文件，按月份降序排列"""
+        # 过滤掉非月份格式的文件（直接用目录项的文件名，不为每个文件构造 Path）
+        month_names = []
+        with os.scandir(self.history_dir) as it:
+            for entry in it:
+                # 检查是否为 YYYY-MM.jsonl 格式
+                if _MONTH_FILE_RE.match(entry.name) and entry.is_file():
+                    month_names.append(entry.name)
+        # 按文件名降序排列（最新的月份在前，文件名等长可直接比较字符串）
+        month_names.sort(reverse=True)
+        return [self.history_dir / name for name in month_names]
+
     def add(self, original: str, corrected: str = None, text: str = None, status: str = "none"):
         """追加消息到当月文件
 
@@ -108,35 +391,59 @@ class HistoryManager:
 
         result = []
         now = datetime.now()
+        # 从后往前读，遇到的编辑/删除记录作用于更早出现的消息
+        deleted = set()
+        updates: Dict[str, Dict] = {}
+        # 设置了 TTL 时，早于截止时间所在月份的文件无需打开
+        min_month = ""
+        if ttl_minutes > 0:
+            min_month = (now - timedelta(minutes=ttl_minutes)).strftime("%Y-%m")
 
         for filepath in self._get_all_month_files():
-            items = self._read_file(filepath)
-
-            # 如果设置了 TTL，过滤掉过期的消息
-            if ttl_minutes > 0:
-                valid_items = []
-                for item in items:
-                    timestamp_str = item.get("timestamp", "")
-                    if timestamp_str:
-                        try:
-                            item_time = datetime.fromisoformat(timestamp_str)
-                            age_minutes = (now - item_time).total_seconds() / 60
-                            if age_minutes <= ttl_minutes:
-                                valid_items.append(item)
-                        except ValueError:
-                            # 时间戳格式错误，跳过
-                            continue
-                items = valid_items
-
-            # 从末尾取
-            needed = count - len(result)
-            if len(items) >= needed:
-                result = items[-needed:] + result
+            if filepath.stem < min_month:
                 break
-            else:
-                result = items + result
-
-        return result[-count:] if len(result) > count else result
+            for line in self._iter_lines_reverse(filepath):
+                try:
+                    record = _load_line(line)
+                except json.JSONDecodeError:
+                    continue
+                timestamp_str = record.get("timestamp", "")
+                op = record.get("op")
+                if op == "del":
+                    deleted.add(timestamp_str)
+                    continue
+                if op == "upd":
+                    # 越靠后的编辑越新，已有的字段不覆盖
+                    pending = updates.setdefault(timestamp_str, {})
+                    for key in ("text", "status"):
+                        if key in record:
+                            pending.setdefault(key, record[key])
+                    continue
+                if timestamp_str in deleted:
+                    continue
+
+                # 如果设置了 TTL，遇到第一条过期消息即可停止（更早的消息只会更旧）
+                if ttl_minutes > 0:
+                    if not timestamp_str:
+                        continue
+                    try:
+                        item_time = datetime.fromisoformat(timestamp_str)
+                    except ValueError:
+                        # 时间戳格式错误，跳过
+                        continue
+                    if (now - item_time).total_seconds() / 60 > ttl_minutes:
+                        result.reverse()
+                        return result
+
+                if timestamp_str in updates:
+                    record.update(updates[timestamp_str])
+                result.append(record)
+                if len(result) >= count:
+                    result.reverse()
+                    return result
+
+        result.reverse()
+        return result
 
     def get_page(self, page: int, page_size: int) -> Dict:
         """分页获取历史（按时间降序）"""
@@ -165,13 +472,16 @@ class HistoryManager:
             "history": page_data
         }
 
-    def update(self, timestamp: str, text: str, is_manual: bool = False):
+    def update(self, timestamp: str, text: str, is_manual: bool = False) -> bool:
         """编辑指定消息（通过时间戳定位）
 
         Args:
             timestamp: 消息时间戳
             text: 新的文本内容
             is_manual: 是否为用户手动覆盖（双击快捷键）
+
+        Returns:
+            是否找到并修改了消息
         """
         # 根据时间戳确定月份
         try:
@@ -181,24 +491,26 @@ class HistoryManager:
             month = "1970-01"
 
         filepath = self._get_month_file(month)
-        items = self._read_file(filepath)
-
-        old_text = ""
-        for item in items:
-            if item.get("timestamp") == timestamp:
-                old_text = item.get("text", "")
-                item["text"] = text
-                # 如果是手动覆盖，更新状态为 manual
-                if is_manual:
-                    item["status"] = "manual"
-                break
-
-        self._write_file(filepath, items)
+        with self._lock:
+            index = self._get_month_index(filepath)
+            lengths = index["texts"].get(timestamp)
+            if not lengths:
+                return False
+            char_diff = len(text) * len(lengths) - sum(lengths)
+
+            # 追加一条编辑记录，读取时再折叠到原消息上，避免重写整个文件
+            op = {"op": "upd", "timestamp": timestamp, "text": text}
+            # 如果是手动覆盖，更新状态为 manual
+            if is_manual:
+                op["status"] = "manual"
+            self._append_to_file(filepath.name, op)
+            self._compact_if_needed(filepath, index["items"], index["ops"])
         # 更新统计（字数差）
-        self._update_stats_diff(len(text) - len(old_text))
+        self._update_stats_diff(char_diff)
+        return True
 
-    def delete(self, timestamp: str):
-        """删除指定消息（通过时间戳定位）"""
+    def delete(self, timestamp: str) -> bool:
+        """删除指定消息（通过时间戳定位），返回是否找到并删除"""
         # 根据时间戳确定月份
         try:
             dt = datetime.fromisoformat(timestamp)
@@ -207,38 +519,57 @@ class HistoryManager:
             month = "1970-01"
 
         filepath = self._get_month_file(month)
-        items = self._read_file(filepath)
-
-        deleted_text = ""
-        new_items = []
-        for item in items:
-            if item.get("timestamp") == timestamp:
-                deleted_text = item.get("text", "")
-            else:
-                new_items.append(item)
-
-        self._write_file(filepath, new_items)
+        with self._lock:
+            index = self._get_month_index(filepath)
+            lengths = index["texts"].get(timestamp)
+            if not lengths:
+                return False
+            deleted_chars = sum(lengths)
+            deleted_count = len(lengths)
+
+            # 追加一条删除记录（墓碑），读取时再过滤，避免重写整个文件
+            self._append_to_file(filepath.name, {"op": "del", "timestamp": timestamp})
+            self._compact_if_needed(filepath, index["items"], index["ops"])
         # 更新统计
-        if deleted_text:
-            self._update_stats_diff(-len(deleted_text), -1)
+        self._update_stats_diff(-deleted_chars, -deleted_count)
+        return True
 
     def clear(self):
         """清空所有历史"""
-        for filepath in self._get_all_month_files():
-            filepath.unlink()
-        # 清空统计
-        self._save_stats({"total_chars": 0, "total_count": 0, "updated_at": datetime.now().isoformat()})
-
-    def get_stats(self) -> Dict:
-        """获取统计信息"""
-        if self.stats_file.exists():
+        with self._lock:
+            for filepath in self._get_all_month_files():
+                self._close_append_handle(filepath.name)
+                filepath.unlink()
+            self._month_files_cache = None
+            self._month_index.clear()
+            self._files_generation += 1
+            # 清空统计
+            self._pending_chars = 0
+            self._pending_count = 0
+            self._save_stats({"total_chars": 0, "total_count": 0, "updated_at": datetime.now().isoformat()})
+
+    def _load_stats(self) -> Dict:
+        """读取 stats.json（不含未落盘的增量），读取后缓存在内存中"""
+        with self._lock:
+            if self._stats is not None:
+                return dict(self._stats)
             try:
-                with open(self.stats_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                self._stats = _load_json(self.stats_file.read_bytes())
+                return dict(self._stats)
             except (json.JSONDecodeError, IOError):
                 pass
-        # 重新计算
-        return self._recalculate_stats()
+        # 文件缺失或损坏：后台重新计算，先返回空统计
+        self._start_recalculate()
+        return {"total_chars": 0, "total_count": 0}
+
+    def get_stats(self) -> Dict:
+        """获取统计信息（包含尚未落盘的增量）"""
+        with self._lock:
+            stats = self._load_stats()
+            if self._pending_chars or self._pending_count:
+                stats["total_chars"] = max(0, stats.get("total_chars", 0) + self._pending_chars)
+                stats["total_count"] = max(0, stats.get("total_count", 0) + self._pending_count)
+            return stats
 
     def get_today_stats(self) -> Dict:
         """获取今日统计"""
@@ -257,42 +588,79 @@ class HistoryManager:
         return {"today_chars": today_chars, "today_count": today_count}
 
     def _save_stats(self, stats: Dict):
-        """保存统计信息"""
-        with open(self.stats_file, "w", encoding="utf-8") as f:
-            json.dump(stats, f, ensure_ascii=False, indent=2)
+        """保存统计信息（同时更新内存缓存）"""
+        with self._lock:
+            _atomic_write_json(self.stats_file, stats)
+            self._stats = dict(stats)
 
     def _update_stats_add(self, text: str):
-        """添加消息时更新统计"""
-        stats = self.get_stats()
-        stats["total_chars"] = stats.get("total_chars", 0) + len(text)
-        stats["total_count"] = stats.get("total_count", 0) + 1
-        stats["updated_at"] = datetime.now().isoformat()
-        self._save_stats(stats)
+        """添加消息时更新统计（记入内存增量，稍后合并落盘）"""
+        with self._lock:
+            self._pending_chars += len(text)
+            self._pending_count += 1
+        self._schedule_flush()
 
     def _update_stats_diff(self, char_diff: int, count_diff: int = 0):
-        """更新统计（差值）"""
-        stats = self.get_stats()
-        stats["total_chars"] = max(0, stats.get("total_chars", 0) + char_diff)
-        stats["total_count"] = max(0, stats.get("total_count", 0) + count_diff)
-        stats["updated_at"] = datetime.now().isoformat()
-        self._save_stats(stats)
+        """更新统计（差值），编辑/删除时立即落盘"""
+        with self._lock:
+            self._pending_chars += char_diff
+            self._pending_count += count_diff
+            self.flush()
+
+    def _start_recalculate(self):
+        """在后台线程中重新计算统计（同一时间只运行一个）"""
+        with self._lock:
+            if self._recalculating:
+                return
+            self._recalculating = True
+        threading.Thread(target=self._recalculate_stats, daemon=True).start()
 
     def _recalculate_stats(self) -> Dict:
-        """重新计算统计"""
-        total_chars = 0
-        total_count = 0
-        for filepath in self._get_all_month_files():
-            items = self._read_file(filepath)
-            total_count += len(items)
-            total_chars += sum(len(item.get("text", "")) for item in items)
+        """重新计算统计（全量扫描，仅在 stats.json 缺失或损坏时使用）
 
-        stats = {
-            "total_chars": total_chars,
-            "total_count": total_count,
-            "updated_at": datetime.now().isoformat()
-        }
-        self._save_stats(stats)
-        return stats
+        扫描不持有锁：先在锁内记下各文件当前大小并清零增量，只扫描这些字节，
+        扫描期间新增的记录照常计入增量，完成后在锁内与扫描结果合并。
+        扫描期间文件被重写或清空时重新扫描。
+        """
+        try:
+            while True:
+                with self._lock:
+                    generation = self._files_generation
+                    for f in self._append_handles.values():
+                        f.flush()
+                    sizes = {}
+                    for filepath in self._get_all_month_files():
+                        try:
+                            sizes[filepath] = filepath.stat().st_size
+                        except FileNotFoundError:
+                            continue
+                    # 快照已包含所有已写入的记录，之前的增量随之作废
+                    self._pending_chars = 0
+                    self._pending_count = 0
+
+                total_chars = 0
+                total_count = 0
+                for filepath, size in sizes.items():
+                    items, _ = self._fold_records(self._read_records(filepath, size))
+                    total_count += len(items)
+                    total_chars += sum(len(item.get("text", "")) for item in items)
+
+                with self._lock:
+                    if generation != self._files_generation:
+                        continue
+                    stats = {
+                        "total_chars": max(0, total_chars + self._pending_chars),
+                        "total_count": max(0, total_count + self._pending_count),
+                        "updated_at": datetime.now().isoformat()
+                    }
+                    self._pending_chars = 0
+                    self._pending_count = 0
+                    self._recalculating = False
+                    self._save_stats(stats)
+                    return stats
+        finally:
+            with self._lock:
+                self._recalculating = False
 
     def migrate_from_config(self, old_history: List):
         """从 config.json 迁移旧数据"""
@@ -306,6 +674,7 @@ class HistoryManager:
                     "text": item,
                     "timestamp": "1970-01-01T00:00:00"
                 })
+                self._update_stats_add(item)
             elif isinstance(item, dict) and "text" in item:
                 # 新格式，按月份写入对应文件
                 timestamp = item.get("timestamp", "1970-01-01T00:00:00")
@@ -315,9 +684,10 @@ class HistoryManager:
                 except ValueError:
                     month = "1970-01"
                 self._append_to_file(f"{month}.jsonl", item)
+                self._update_stats_add(item.get("text", ""))
 
-        # 更新统计
-        self._recalculate_stats()
+        # 统计已按条累加，立即落盘
+        self.flush()
 
 
 class ConfigManager:
@@ -367,6 +737,7 @@ class ConfigManager:
             "api_key": "",
             "model": "qwen3-asr-flash",
             "base_url": "https://dashscope.aliyuncs.com/compatible-mode/v1",
+            "audio_codec": "wav",  # 上传音频编码：wav 或 opus（需要 opuslib）
             "volcengine_app_key": "",
             "volcengine_access_key": ""
         },
@@ -379,7 +750,10 @@ class ConfigManager:
             "context_correction_enabled": False,
             "context_window_size": 5,
             "context_history_ttl": 10,  # 历史消息有效期（分钟）
-            "context_correction_prompt": DEFAULT_CONTEXT_CORRECTION_PROMPT
+            "context_correction_prompt": DEFAULT_CONTEXT_CORRECTION_PROMPT,
+            "fused_correction": True,  # 两种纠错都开启时合并为一次请求
+            "parallel_correction": False,  # 不合并时，两种纠错并发请求（峰值请求数翻倍）
+            "skip_clean_correction": False  # 短文字跳过纠错（短且只含常用汉字跳过语音纠错，过短跳过上下文纠错）
         },
     }
 
@@ -388,6 +762,16 @@ class ConfigManager:
         self.config_dir = Path.home() / ".voice_input"
         self.config_file = self.config_dir / "config.json"
 
+        # 延迟保存，连续修改多个字段时只写一次文件
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
+        # batch() 嵌套深度，及批量修改期间是否有未保存的修改
+        self._batch_depth = 0
+        self._dirty = False
+        # 配置版本号，每次修改或重新加载时递增，供调用方判断缓存是否失效
+        self._version = 0
+        atexit.register(self.save)
+
         # 加载或创建配置
         self._config = self._load_config()
 
@@ -401,25 +785,32 @@ class ConfigManager:
 
         if self.config_file.exists():
             try:
-                with open(self.config_file, "r", encoding="utf-8") as f:
-                    config = json.load(f)
+                config = _load_json(self.config_file.read_bytes())
                 # 合并默认配置，确保所有字段都存在
                 return self._merge_config(self.DEFAULT_CONFIG, config)
             except (json.JSONDecodeError, IOError):
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(self.DEFAULT_CONFIG)
         else:
             # 创建默认配置
             self._save_config(self.DEFAULT_CONFIG)
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
 
     def _merge_config(self, default: Dict, user: Dict) -> Dict:
-        """递归合并配置，确保所有默认字段都存在"""
-        result = default.copy()
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_config(result[key], value)
-            else:
-                result[key] = value
+        """合并配置，确保所有默认字段都存在
+
+        深拷贝一次默认配置后原地合并，嵌套字典用栈迭代处理。
+        （浅拷贝会让 setter 修改到 DEFAULT_CONFIG 的嵌套字典）
+        """
+        result = copy.deepcopy(default)
+        stack = [(result, user)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return result
 
     def _save_config(self, config: Optional[Dict] = None):
@@ -428,12 +819,65 @@ class ConfigManager:
             config = self._config
 
         self.config_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, ensure_ascii=False, indent=2)
+        _atomic_write_json(self.config_file, config)
+
+    def _schedule_save(self):
+        """安排一次延迟保存，已有待保存时重新计时"""
+        with self._save_lock:
+            self._version += 1
+            if self._batch_depth > 0:
+                # 批量修改中，退出 batch() 时统一保存
+                self._dirty = True
+                return
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(CONFIG_SAVE_DELAY, self.save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    @contextmanager
+    def batch(self):
+        """批量修改配置，期间不保存，退出时只写一次文件
+
+        用法：
+            with config.batch():
+                config.asr_model = ...
+                config.llm_model = ...
+        """
+        with self._save_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._save_lock:
+                self._batch_depth -= 1
+                need_save = self._batch_depth == 0 and self._dirty
+            if need_save:
+                self.save()
 
     def save(self):
-        """保存当前配置"""
-        self._save_config()
+        """立即保存当前配置（取消待执行的延迟保存）"""
+        with self._save_lock:
+            self._dirty = False
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._save_config()
+
+    def reload(self):
+        """从文件重新加载配置（先写入尚未保存的修改）"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+                self._save_config()
+            self._config = self._load_config()
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """配置版本号（配置有修改时变化）"""
+        return self._version
 
     # ========== 快捷键配置 ==========
 
@@ -446,7 +890,7 @@ class ConfigManager:
     def shortcut_key(self, value: str):
         """设置快捷键标识"""
         self._config["shortcut"]["key"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def shortcut_display(self) -> str:
@@ -457,13 +901,13 @@ class ConfigManager:
     def shortcut_display(self, value: str):
         """设置快捷键显示名称"""
         self._config["shortcut"]["display"] = value
-        self._save_config()
+        self._schedule_save()
 
     def set_shortcut(self, key: str, display: str):
         """设置快捷键"""
         self._config["shortcut"]["key"] = key
         self._config["shortcut"]["display"] = display
-        self._save_config()
+        self._schedule_save()
 
     # ========== 麦克风配置 ==========
 
@@ -476,7 +920,7 @@ class ConfigManager:
     def microphone_device_id(self, value: Optional[int]):
         """设置麦克风设备 ID"""
         self._config["microphone"]["device_id"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def microphone_device_name(self) -> str:
@@ -487,13 +931,13 @@ class ConfigManager:
     def microphone_device_name(self, value: str):
         """设置麦克风设备名称"""
         self._config["microphone"]["device_name"] = value
-        self._save_config()
+        self._schedule_save()
 
     def set_microphone(self, device_id: Optional[int], device_name: str):
         """设置麦克风"""
         self._config["microphone"]["device_id"] = device_id
         self._config["microphone"]["device_name"] = device_name
-        self._save_config()
+        self._schedule_save()
 
     # ========== 录音配置 ==========
 
@@ -506,7 +950,7 @@ class ConfigManager:
     def recording_max_duration(self, value: int):
         """设置最长录音时长（10-120 秒）"""
         self._config["recording"]["max_duration"] = max(10, min(120, value))
-        self._save_config()
+        self._schedule_save()
 
     @property
     def recording_silence_timeout(self) -> int:
@@ -517,7 +961,7 @@ class ConfigManager:
     def recording_silence_timeout(self, value: int):
         """设置静音超时时间（2-10 秒）"""
         self._config["recording"]["silence_timeout"] = max(2, min(10, value))
-        self._save_config()
+        self._schedule_save()
 
     # ========== ASR 配置 ==========
 
@@ -530,7 +974,7 @@ class ConfigManager:
     def asr_provider(self, value: str):
         """设置 ASR 提供商"""
         self._config["asr"]["provider"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def asr_api_key(self) -> str:
@@ -541,7 +985,7 @@ class ConfigManager:
     def asr_api_key(self, value: str):
         """设置 ASR API Key"""
         self._config["asr"]["api_key"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def asr_model(self) -> str:
@@ -552,7 +996,7 @@ class ConfigManager:
     def asr_model(self, value: str):
         """设置 ASR 模型"""
         self._config["asr"]["model"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def asr_base_url(self) -> str:
@@ -563,7 +1007,18 @@ class ConfigManager:
     def asr_base_url(self, value: str):
         """设置 ASR API Base URL"""
         self._config["asr"]["base_url"] = value
-        self._save_config()
+        self._schedule_save()
+
+    @property
+    def asr_audio_codec(self) -> str:
+        """获取上传音频编码（wav / opus）"""
+        return self._config["asr"].get("audio_codec", "wav")
+
+    @asr_audio_codec.setter
+    def asr_audio_codec(self, value: str):
+        """设置上传音频编码（wav / opus）"""
+        self._config["asr"]["audio_codec"] = value
+        self._schedule_save()
 
     def get_effective_api_key(self) -> Optional[str]:
         """获取有效的 API Key（优先使用配置，其次环境变量）"""
@@ -580,7 +1035,7 @@ class ConfigManager:
     def volcengine_app_key(self, value: str):
         """设置火山引擎 App Key"""
         self._config["asr"]["volcengine_app_key"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def volcengine_access_key(self) -> str:
@@ -591,7 +1046,7 @@ class ConfigManager:
     def volcengine_access_key(self, value: str):
         """设置火山引擎 Access Key"""
         self._config["asr"]["volcengine_access_key"] = value
-        self._save_config()
+        self._schedule_save()
 
     def get_effective_volcengine_keys(self) -> dict:
         """获取有效的火山引擎密钥（优先使用配置，其次环境变量）"""
@@ -610,7 +1065,7 @@ class ConfigManager:
     def llm_api_key(self, value: str):
         """设置 LLM API Key"""
         self._config["llm"]["api_key"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def llm_provider(self) -> str:
@@ -621,7 +1076,12 @@ class ConfigManager:
     def llm_provider(self, value: str):
         """设置 LLM 提供商"""
         self._config["llm"]["provider"] = value
-        self._save_config()
+        self._schedule_save()
+
+    @property
+    def llm_base_url(self) -> str:
+        """获取当前 LLM 提供商的接口地址"""
+        return LLM_BASE_URLS.get(self.llm_provider, DEFAULT_LLM_BASE_URL)
 
     @property
     def llm_model(self) -> str:
@@ -632,7 +1092,7 @@ class ConfigManager:
     def llm_model(self, value: str):
         """设置 LLM 模型"""
         self._config["llm"]["model"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def llm_correction_enabled(self) -> bool:
@@ -643,7 +1103,7 @@ class ConfigManager:
     def llm_correction_enabled(self, value: bool):
         """设置是否启用 LLM 纠错"""
         self._config["llm"]["correction_enabled"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def llm_correction_prompt(self) -> str:
@@ -654,7 +1114,7 @@ class ConfigManager:
     def llm_correction_prompt(self, value: str):
         """设置 LLM 纠错提示词"""
         self._config["llm"]["correction_prompt"] = value
-        self._save_config()
+        self._schedule_save()
 
     def get_effective_llm_api_key(self) -> Optional[str]:
         """获取有效的 LLM API Key（优先使用配置，其次环境变量）"""
@@ -673,7 +1133,7 @@ class ConfigManager:
     def context_correction_enabled(self, value: bool):
         """设置是否启用上下文纠错"""
         self._config["llm"]["context_correction_enabled"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def context_window_size(self) -> int:
@@ -684,7 +1144,7 @@ class ConfigManager:
     def context_window_size(self, value: int):
         """设置上下文窗口大小（1-10）"""
         self._config["llm"]["context_window_size"] = max(1, min(10, value))
-        self._save_config()
+        self._schedule_save()
 
     @property
     def context_correction_prompt(self) -> str:
@@ -695,7 +1155,7 @@ class ConfigManager:
     def context_correction_prompt(self, value: str):
         """设置上下文纠错提示词"""
         self._config["llm"]["context_correction_prompt"] = value
-        self._save_config()
+        self._schedule_save()
 
     @property
     def context_history_ttl(self) -> int:
@@ -706,7 +1166,40 @@ class ConfigManager:
     def context_history_ttl(self, value: int):
         """设置上下文历史有效期（5-1440 分钟）"""
         self._config["llm"]["context_history_ttl"] = max(5, min(1440, value))
-        self._save_config()
+        self._schedule_save()
+
+    @property
+    def fused_correction_enabled(self) -> bool:
+        """获取是否合并语音纠错和上下文纠错为一次请求"""
+        return self._config["llm"].get("fused_correction", True)
+
+    @fused_correction_enabled.setter
+    def fused_correction_enabled(self, value: bool):
+        """设置是否合并语音纠错和上下文纠错为一次请求"""
+        self._config["llm"]["fused_correction"] = value
+        self._schedule_save()
+
+    @property
+    def parallel_correction_enabled(self) -> bool:
+        """获取是否并发执行语音纠错和上下文纠错"""
+        return self._config["llm"].get("parallel_correction", False)
+
+    @parallel_correction_enabled.setter
+    def parallel_correction_enabled(self, value: bool):
+        """设置是否并发执行语音纠错和上下文纠错"""
+        self._config["llm"]["parallel_correction"] = value
+        self._schedule_save()
+
+    @property
+    def skip_clean_correction_enabled(self) -> bool:
+        """获取是否对短文字跳过语音纠错和上下文纠错"""
+        return self._config["llm"].get("skip_clean_correction", False)
+
+    @skip_clean_correction_enabled.setter
+    def skip_clean_correction_enabled(self, value: bool):
+        """设置是否对短文字跳过语音纠错和上下文纠错"""
+        self._config["llm"]["skip_clean_correction"] = value
+        self._schedule_save()
 
     def _migrate_history_if_needed(self):
         """检查并迁移旧历史数据"""
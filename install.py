@@ -5,7 +5,6 @@
 import os
 import sys
 import subprocess
-import venv
 from pathlib import Path
 
 
@@ -23,6 +22,8 @@ def get_platform():
 
 def create_venv(venv_path: Path):
     """创建虚拟环境"""
+    import venv
+
     print(f"创建虚拟环境: {venv_path}")
     venv.create(venv_path, with_pip=True)
 
@@ -43,6 +44,13 @@ def get_python_path(venv_path: Path) -> Path:
         return venv_path / "bin" / "python"
 
 
+def get_wheels_dir() -> Path:
+    """获取依赖包缓存目录"""
+    wheels_dir = Path.home() / ".voice_input" / "wheels"
+    wheels_dir.mkdir(parents=True, exist_ok=True)
+    return wheels_dir
+
+
 def install_requirements(venv_path: Path, platform: str):
     """安装依赖"""
     pip_path = get_pip_path(venv_path)
@@ -60,12 +68,24 @@ def install_requirements(venv_path: Path, platform: str):
         print(f"错误: 依赖文件不存在: {req_file}")
         return False
 
-    print(f"安装依赖: {req_file}")
-    result = subprocess.run(
-        [str(pip_path), "install", "-r", str(req_file)],
+    # 先把依赖下载到本地缓存目录（pip download 会并行下载），再从缓存安装；
+    # 重复安装时已下载的包无需再走网络
+    wheels_dir = get_wheels_dir()
+    print(f"下载依赖到缓存: {wheels_dir}")
+    download = subprocess.run(
+        [str(pip_path), "download", "-r", str(req_file), "-d", str(wheels_dir)],
         capture_output=False
     )
 
+    print(f"安装依赖: {req_file}")
+    cmd = [str(pip_path), "install", "-r", str(req_file)]
+    if download.returncode == 0:
+        # 仍保留在线索引：构建源码包所需的工具可能不在缓存中
+        cmd += ["--find-links", str(wheels_dir)]
+    else:
+        print("下载到缓存失败，改为直接安装")
+    result = subprocess.run(cmd, capture_output=False)
+
     return result.returncode == 0
 
 
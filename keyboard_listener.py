@@ -3,74 +3,107 @@
 """
 import sys
 import time
+import functools
 import threading
-from pynput import keyboard
-from typing import Callable, Optional, Tuple, Set, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Set, List
 
 
 # 双击检测间隔（秒）
 DOUBLE_CLICK_INTERVAL = 0.4
+DOUBLE_CLICK_INTERVAL_NS = int(DOUBLE_CLICK_INTERVAL * 1_000_000_000)
+
+# 快捷键录制器的回调在单个常驻线程中执行，避免每次回调都新建线程
+_RECORDER_CALLBACK_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shortcut-recorder")
 
 # 平台检测
 IS_MACOS = sys.platform == "darwin"
 IS_WINDOWS = sys.platform == "win32"
 
-# 快捷键映射 - 基础映射（跨平台）
+# 快捷键映射 - 基础映射（跨平台）：标识符 -> pynput Key 的属性名
+# （只存名字，pynput 在真正需要时才导入，见 _get_key_map）
 SHORTCUT_KEY_MAP = {
-    "ctrl_r": keyboard.Key.ctrl_r,
-    "ctrl_l": keyboard.Key.ctrl_l,
-    "ctrl": keyboard.Key.ctrl_l,  # 通用 ctrl，不区分左右
-    "alt_r": keyboard.Key.alt_r,
-    "alt_l": keyboard.Key.alt_l,
-    "alt": keyboard.Key.alt_l,  # 通用 alt
-    "shift_r": keyboard.Key.shift_r,
-    "shift_l": keyboard.Key.shift_l,
-    "shift": keyboard.Key.shift_l,  # 通用 shift
-    "caps_lock": keyboard.Key.caps_lock,
-    "space": keyboard.Key.space,
-    "tab": keyboard.Key.tab,
-    "f1": keyboard.Key.f1,
-    "f2": keyboard.Key.f2,
-    "f3": keyboard.Key.f3,
-    "f4": keyboard.Key.f4,
-    "f5": keyboard.Key.f5,
-    "f6": keyboard.Key.f6,
-    "f7": keyboard.Key.f7,
-    "f8": keyboard.Key.f8,
-    "f9": keyboard.Key.f9,
-    "f10": keyboard.Key.f10,
-    "f11": keyboard.Key.f11,
-    "f12": keyboard.Key.f12,
+    "ctrl_r": "ctrl_r",
+    "ctrl_l": "ctrl_l",
+    "ctrl": "ctrl_l",  # 通用 ctrl，不区分左右
+    "alt_r": "alt_r",
+    "alt_l": "alt_l",
+    "alt": "alt_l",  # 通用 alt
+    "shift_r": "shift_r",
+    "shift_l": "shift_l",
+    "shift": "shift_l",  # 通用 shift
+    "caps_lock": "caps_lock",
+    "space": "space",
+    "tab": "tab",
+    "f1": "f1",
+    "f2": "f2",
+    "f3": "f3",
+    "f4": "f4",
+    "f5": "f5",
+    "f6": "f6",
+    "f7": "f7",
+    "f8": "f8",
+    "f9": "f9",
+    "f10": "f10",
+    "f11": "f11",
+    "f12": "f12",
 }
 
 # macOS 专用键
 if IS_MACOS:
     SHORTCUT_KEY_MAP.update({
-        "cmd_r": keyboard.Key.cmd_r,
-        "cmd_l": keyboard.Key.cmd_l,
-        "cmd": keyboard.Key.cmd_l,  # 通用 cmd
-        "fn": keyboard.Key.f20,
+        "cmd_r": "cmd_r",
+        "cmd_l": "cmd_l",
+        "cmd": "cmd_l",  # 通用 cmd
+        "fn": "f20",
     })
 
 # Windows 专用键
 if IS_WINDOWS:
     SHORTCUT_KEY_MAP.update({
-        "win_r": keyboard.Key.cmd_r,  # Windows 键映射
-        "win_l": keyboard.Key.cmd_l,
-        "win": keyboard.Key.cmd_l,  # 通用 win
+        "win_r": "cmd_r",  # Windows 键映射
+        "win_l": "cmd_l",
+        "win": "cmd_l",  # 通用 win
     })
 
-# 反向映射：Key -> 标识符
-KEY_TO_NAME = {v: k for k, v in SHORTCUT_KEY_MAP.items()}
+
+@functools.lru_cache(maxsize=None)
+def _get_keyboard():
+    """延迟导入 pynput.keyboard（导入时会初始化平台原生钩子，较慢）"""
+    from pynput import keyboard
+    return keyboard
+
+
+@functools.lru_cache(maxsize=None)
+def _get_key_map() -> Dict[str, Any]:
+    """获取快捷键映射：标识符 -> pynput Key"""
+    key_cls = _get_keyboard().Key
+    return {name: getattr(key_cls, attr) for name, attr in SHORTCUT_KEY_MAP.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_key_to_name() -> Dict[Any, str]:
+    """获取反向映射：pynput Key -> 标识符"""
+    return {v: k for k, v in _get_key_map().items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_special_key_info() -> Dict[Any, Tuple[str, str, bool]]:
+    """获取特殊键的预计算信息：pynput Key -> (原始键名, 规范化键名, 是否为修饰键)"""
+    return {
+        key: _describe_key_name(name, MODIFIER_NORMALIZE, MODIFIER_KEYS)
+        for key, name in _get_key_to_name().items()
+    }
+
 
 # 修饰键集合（用于判断是否是修饰键）
-MODIFIER_KEYS = {
+MODIFIER_KEYS = frozenset({
     "ctrl", "ctrl_l", "ctrl_r",
     "alt", "alt_l", "alt_r",
     "shift", "shift_l", "shift_r",
     "cmd", "cmd_l", "cmd_r",
     "win", "win_l", "win_r",
-}
+})
 
 # 修饰键规范化映射（将左右区分的修饰键映射到通用名）
 MODIFIER_NORMALIZE = {
@@ -81,6 +114,12 @@ MODIFIER_NORMALIZE = {
     "win_l": "win", "win_r": "win",
 }
 
+# 修饰键的显示/格式化顺序
+_MODIFIER_ORDER = ("ctrl", "alt", "shift", "cmd", "win")
+
+# 规范化修饰键对应的位，按下的修饰键组合用整数位掩码表示
+MODIFIER_BITS = {"ctrl": 1, "alt": 2, "shift": 4, "cmd": 8, "win": 16}
+
 # 显示名称映射
 KEY_DISPLAY_NAMES = {
     "cmd_r": "Right Command",
@@ -108,10 +147,13 @@ KEY_DISPLAY_NAMES = {
 }
 
 
-def parse_shortcut(shortcut_str: str) -> Tuple[Set[str], Optional[str]]:
+@functools.lru_cache(maxsize=256)
+def parse_shortcut(shortcut_str: str) -> Tuple[FrozenSet[str], Optional[str]]:
     """
     解析快捷键字符串，返回 (修饰键集合, 主键)
 
+    结果会被缓存，修饰键集合为不可变的 frozenset
+
     格式示例:
     - "ctrl+shift+a" -> ({"ctrl", "shift"}, "a")
     - "cmd+space" -> ({"cmd"}, "space")
@@ -125,7 +167,7 @@ def parse_shortcut(shortcut_str: str) -> Tuple[Set[str], Optional[str]]:
         (修饰键集合, 主键) 元组
     """
     if not shortcut_str:
-        return set(), None
+        return frozenset(), None
 
     shortcut_str = shortcut_str.lower().strip()
 
@@ -144,11 +186,11 @@ def parse_shortcut(shortcut_str: str) -> Tuple[Set[str], Optional[str]]:
                 # 最后一个非修饰键是主键
                 main_key = part
 
-        return modifiers, main_key
+        return frozenset(modifiers), main_key
     else:
         # 单键格式（向后兼容）
         # 检查是否是修饰键（如 cmd_r），如果是则作为主键处理
-        return set(), shortcut_str
+        return frozenset(), shortcut_str
 
 
 def format_shortcut(modifiers: Set[str], main_key: Optional[str]) -> str:
@@ -162,10 +204,16 @@ def format_shortcut(modifiers: Set[str], main_key: Optional[str]) -> str:
     Returns:
         快捷键字符串，如 "ctrl+shift+a"
     """
+    return _format_shortcut(frozenset(modifiers), main_key)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_shortcut(modifiers: FrozenSet[str], main_key: Optional[str]) -> str:
+    """format_shortcut 的缓存实现"""
     parts = []
 
     # 按固定顺序添加修饰键
-    for mod in ["ctrl", "alt", "shift", "cmd", "win"]:
+    for mod in _MODIFIER_ORDER:
         if mod in modifiers:
             parts.append(mod)
 
@@ -175,6 +223,7 @@ def format_shortcut(modifiers: Set[str], main_key: Optional[str]) -> str:
     return "+".join(parts) if parts else ""
 
 
+@functools.lru_cache(maxsize=256)
 def get_shortcut_display(shortcut_str: str) -> str:
     """
     获取快捷键的显示名称
@@ -192,7 +241,7 @@ def get_shortcut_display(shortcut_str: str) -> str:
         return KEY_DISPLAY_NAMES.get(main_key, main_key.upper())
 
     parts = []
-    for mod in ["ctrl", "alt", "shift", "cmd", "win"]:
+    for mod in _MODIFIER_ORDER:
         if mod in modifiers:
             parts.append(KEY_DISPLAY_NAMES.get(mod, mod.title()))
 
@@ -212,47 +261,62 @@ def get_default_shortcut() -> Tuple[str, str]:
         return ("ctrl_r", "Right Control")
 
 
-def _normalize_key(key) -> Optional[str]:
+@functools.lru_cache(maxsize=512)
+def _resolve_key(key, _normalize=MODIFIER_NORMALIZE,
+                 _modifiers=MODIFIER_KEYS) -> Tuple[Optional[str], Optional[str], bool]:
     """
-    将 pynput 的 key 对象规范化为字符串标识
-
-    Args:
-        key: pynput 的 Key 对象或 KeyCode
+    解析按键事件的键名（结果按 key 缓存，每次按键只需一次字典查找）
 
     Returns:
-        规范化的键标识符，如 "ctrl", "a", "f1" 等
+        (原始键名, 规范化键名, 是否为修饰键)，无法识别时键名为 None
     """
-    # 特殊键
-    if key in KEY_TO_NAME:
-        name = KEY_TO_NAME[key]
-        # 规范化修饰键
-        return MODIFIER_NORMALIZE.get(name, name)
-
-    # 普通字符键
-    if hasattr(key, 'char') and key.char:
-        return key.char.lower()
-
-    # 通过 vk 或 name 属性获取
-    if hasattr(key, 'name'):
-        return key.name.lower()
+    # 特殊键：直接使用预先计算好的结果
+    info = _get_special_key_info().get(key)
+    if info is not None:
+        return info
+
+    # 获取原始键名（不规范化）：字符键 -> 按键名
+    raw_key_name = None
+    char = getattr(key, 'char', None)
+    if char:
+        raw_key_name = char.lower()
+    else:
+        name = getattr(key, 'name', None)
+        if name:
+            raw_key_name = name.lower()
 
-    return None
+    if not raw_key_name:
+        return None, None, False
+    return _describe_key_name(raw_key_name, _normalize, _modifiers)
 
 
-def _is_modifier_key(key) -> bool:
-    """判断是否是修饰键"""
-    key_name = _normalize_key(key)
-    if key_name:
-        return key_name in MODIFIER_KEYS or MODIFIER_NORMALIZE.get(key_name) in MODIFIER_KEYS
-    return False
+def _describe_key_name(raw_key_name: str, normalize: Dict[str, str],
+                       modifiers: FrozenSet[str]) -> Tuple[str, str, bool]:
+    """根据原始键名得到 (原始键名, 规范化键名, 是否为修饰键)"""
+    normalized_key_name = normalize.get(raw_key_name, raw_key_name)
+    is_modifier = raw_key_name in modifiers or normalized_key_name in modifiers
+    return raw_key_name, normalized_key_name, is_modifier
 
 
 class KeyboardListener:
     """监听可配置的快捷键（支持组合键）"""
 
+    # 事件回调里频繁读写实例属性，使用 __slots__ 省去实例 __dict__
+    __slots__ = (
+        "callback", "double_click_callback", "should_handle_double_click", "listener",
+        "_shortcut_str", "_required_modifiers", "_required_mask", "_single_allowed_mask",
+        "_main_key", "_is_single_key_mode", "_key_dispatch",
+        "_pressed_mask", "_main_key_pressed", "_main_key_press_time", "_other_key_pressed",
+        "_last_release_time", "_single_click_deadline", "_lock",
+        "_scheduler_cond", "_scheduler_thread", "_scheduler_stopped", "_callback_executor",
+    )
+
     # 时间阈值（秒）
     MIN_PRESS_TIME = 0.05   # 最短按下时间 50ms，避免误触
     MAX_PRESS_TIME = 1.5    # 最长按下时间 1.5s，避免正常按压被误判为长按
+    # 同上，纳秒整数（与 time.monotonic_ns() 比较）
+    MIN_PRESS_NS = int(MIN_PRESS_TIME * 1_000_000_000)
+    MAX_PRESS_NS = int(MAX_PRESS_TIME * 1_000_000_000)
 
     def __init__(self, callback: Callable, shortcut_key: str = "cmd_r",
                  double_click_callback: Callable = None,
@@ -271,21 +335,32 @@ class KeyboardListener:
 
         # 当前监听的快捷键配置
         self._shortcut_str = shortcut_key
-        self._required_modifiers: Set[str] = set()  # 需要的修饰键
+        self._required_modifiers: FrozenSet[str] = frozenset()  # 需要的修饰键
+        self._required_mask = 0  # 需要的修饰键位掩码
+        self._single_allowed_mask = 0  # 单键模式下允许同时按下的修饰键位（主键本身是修饰键时）
         self._main_key: Optional[str] = None  # 主键
         self._is_single_key_mode = False  # 是否是单键模式（向后兼容）
+        # 按键分派表：pynput key -> (是否可识别, 修饰键位, 是否主键, 原始键名是否为主键)
+        # 每个按键首次出现时解析一次，快捷键变化时清空
+        self._key_dispatch: Dict[Any, Tuple[bool, int, bool, bool]] = {}
 
         # 解析快捷键
         self._parse_and_set_shortcut(shortcut_key)
 
         # 状态跟踪
-        self._pressed_modifiers: Set[str] = set()  # 当前按下的修饰键
+        self._pressed_mask = 0  # 当前按下的修饰键位掩码
         self._main_key_pressed = False  # 主键是否按下
-        self._main_key_press_time = 0  # 主键按下时间
+        self._main_key_press_time = 0  # 主键按下时间（monotonic_ns）
         self._other_key_pressed = False  # 是否按下了其他键
-        self._last_release_time = 0  # 上一次释放时间，用于双击检测
-        self._pending_single_click = None  # 待执行的单击定时器
+        self._last_release_time = 0  # 上一次释放时间（monotonic_ns），用于双击检测
+        self._single_click_deadline = 0  # 待执行单击的触发时间（monotonic_ns），0 表示没有
         self._lock = threading.Lock()
+        # 单击延迟由一个常驻调度线程处理，避免每次单击都新建 Timer 线程
+        self._scheduler_cond = threading.Condition(self._lock)
+        self._scheduler_thread: Optional[threading.Thread] = None
+        self._scheduler_stopped = False
+        # 回调在单个常驻线程中按顺序执行，避免每次触发都新建线程
+        self._callback_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="shortcut-callback")
 
     def _parse_and_set_shortcut(self, shortcut_str: str):
         """解析并设置快捷键"""
@@ -294,7 +369,7 @@ class KeyboardListener:
         if not modifiers and main_key:
             # 单键模式（如 cmd_r, f12）
             self._is_single_key_mode = True
-            self._required_modifiers = set()
+            self._required_modifiers = frozenset()
             self._main_key = main_key
         else:
             # 组合键模式
@@ -302,23 +377,63 @@ class KeyboardListener:
             self._required_modifiers = modifiers
             self._main_key = main_key
 
+        self._required_mask = 0
+        for mod in self._required_modifiers:
+            self._required_mask |= MODIFIER_BITS.get(mod, 0)
+        self._single_allowed_mask = MODIFIER_BITS.get(MODIFIER_NORMALIZE.get(main_key), 0)
+        # 最后替换分派表：_classify_key 先取表再读主键，拿到新表时读到的一定是新主键
+        self._key_dispatch = {}
+
+    def _classify_key(self, key) -> Tuple[bool, int, bool, bool]:
+        """解析按键并写入分派表（在监听线程中执行，不加锁）"""
+        # 先取分派表再读主键：并发更新快捷键时，按旧主键解析的记录只会写入已被替换的旧表
+        dispatch = self._key_dispatch
+        raw_key_name, normalized_key_name, is_modifier = _resolve_key(key)
+        main_key = self._main_key
+        is_main_raw = raw_key_name is not None and raw_key_name == main_key
+        is_main = is_main_raw or (normalized_key_name is not None and normalized_key_name == main_key)
+        bit = MODIFIER_BITS.get(normalized_key_name, 0) if is_modifier else 0
+        record = (raw_key_name is not None, bit, is_main, is_main_raw)
+        dispatch[key] = record
+        return record
+
+    def _prime_key_dispatch(self):
+        """预先解析特殊键和主键对应的 pynput 按键对象，填充分派表（需已导入 pynput）"""
+        keyboard = _get_keyboard()
+        for key in _get_key_map().values():
+            self._classify_key(key)
+        main_key = self._main_key
+        if main_key and len(main_key) == 1:
+            # 字符主键（如 "a"）按 KeyCode 预先解析
+            self._classify_key(keyboard.KeyCode.from_char(main_key))
+
     def set_shortcut(self, shortcut_key: str):
         """更新快捷键"""
         with self._lock:
             self._shortcut_str = shortcut_key
             self._parse_and_set_shortcut(shortcut_key)
             # 重置状态
-            self._pressed_modifiers.clear()
+            self._pressed_mask = 0
             self._main_key_pressed = False
             self._main_key_press_time = 0
             self._other_key_pressed = False
             self._last_release_time = 0
-            if self._pending_single_click:
-                self._pending_single_click.cancel()
-                self._pending_single_click = None
+            self._cancel_single_click()
+            if self.listener is not None:
+                self._prime_key_dispatch()
 
     def start(self):
         """启动键盘监听"""
+        with self._lock:
+            self._scheduler_stopped = False
+            if self._scheduler_thread is None or not self._scheduler_thread.is_alive():
+                self._scheduler_thread = threading.Thread(
+                    target=self._scheduler_loop, name="shortcut-scheduler", daemon=True
+                )
+                self._scheduler_thread.start()
+        keyboard = _get_keyboard()
+        with self._lock:
+            self._prime_key_dispatch()
         self.listener = keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release
@@ -327,9 +442,10 @@ class KeyboardListener:
 
     def stop(self):
         """停止键盘监听"""
-        if self._pending_single_click:
-            self._pending_single_click.cancel()
-            self._pending_single_click = None
+        with self._lock:
+            self._cancel_single_click()
+            self._scheduler_stopped = True
+            self._scheduler_cond.notify()
         if self.listener:
             self.listener.stop()
             self.listener = None
@@ -348,152 +464,141 @@ class KeyboardListener:
                 return False
 
             # 检查是否有额外的修饰键
-            main_key_normalized = MODIFIER_NORMALIZE.get(self._main_key)
-            if main_key_normalized:
-                # 主键是修饰键，允许它的规范化版本存在
-                extra_modifiers = self._pressed_modifiers - {main_key_normalized}
-                return len(extra_modifiers) == 0
-            else:
-                # 主键不是修饰键，不能有任何修饰键
-                return len(self._pressed_modifiers) == 0
+            # 主键是修饰键时允许它的规范化版本存在，否则不能有任何修饰键
+            return self._pressed_mask & ~self._single_allowed_mask == 0
         else:
             # 组合键模式：需要所有要求的修饰键 + 主键
             return (self._main_key_pressed and
-                    self._required_modifiers == self._pressed_modifiers)
+                    self._required_mask == self._pressed_mask)
 
     def _on_press(self, key):
         """按键按下事件"""
-        # 获取原始键名（不规范化）
-        raw_key_name = None
-        if key in KEY_TO_NAME:
-            raw_key_name = KEY_TO_NAME[key]
-        elif hasattr(key, 'char') and key.char:
-            raw_key_name = key.char.lower()
-        elif hasattr(key, 'name'):
-            raw_key_name = key.name.lower()
-
-        if not raw_key_name:
+        record = self._key_dispatch.get(key) or self._classify_key(key)
+        known, bit, is_main, is_main_raw = record
+        if not known:
             return
 
-        # 规范化后的键名
-        normalized_key_name = MODIFIER_NORMALIZE.get(raw_key_name, raw_key_name)
+        # 快速路径：既不是修饰键也不是主键，且主键未按下时无需更新状态
+        if not bit and not is_main and not self._main_key_pressed:
+            return
 
-        with self._lock:
-            # 判断是否是修饰键
-            if raw_key_name in MODIFIER_KEYS or normalized_key_name in MODIFIER_KEYS:
-                self._pressed_modifiers.add(normalized_key_name)
-
-                # 单键模式下，修饰键本身也可能是主键
-                # 需要检查原始键名是否匹配（如 cmd_r）
-                if self._is_single_key_mode and raw_key_name == self._main_key:
-                    if not self._main_key_pressed:
-                        self._main_key_pressed = True
-                        self._main_key_press_time = time.time()
-                        self._other_key_pressed = False
-            else:
-                # 非修饰键
-                if raw_key_name == self._main_key or normalized_key_name == self._main_key:
-                    if not self._main_key_pressed:
-                        self._main_key_pressed = True
-                        self._main_key_press_time = time.time()
-                        self._other_key_pressed = False
-                else:
-                    # 其他键被按下
-                    if self._main_key_pressed:
-                        self._other_key_pressed = True
+        # 按住不放时系统会重复发送按下事件，状态未变化则直接跳过
+        if bit:
+            if self._pressed_mask & bit and (not is_main_raw or self._main_key_pressed):
+                return
+        elif is_main and self._main_key_pressed:
+            return
+
+        # 按键状态只由 pynput 的监听线程（串行分发事件）写入，无需加锁；
+        # 锁只保护与调度线程共享的单击/双击状态
+        if bit:
+            self._pressed_mask |= bit
+
+            # 单键模式下，修饰键本身也可能是主键
+            # 需要检查原始键名是否匹配（如 cmd_r）
+            if self._is_single_key_mode and is_main_raw and not self._main_key_pressed:
+                self._main_key_press_time = time.monotonic_ns()
+                self._other_key_pressed = False
+                self._main_key_pressed = True
+        elif is_main:
+            # 非修饰键：主键按下
+            self._main_key_press_time = time.monotonic_ns()
+            self._other_key_pressed = False
+            self._main_key_pressed = True
+        else:
+            # 其他键被按下（此处主键一定处于按下状态）
+            self._other_key_pressed = True
 
     def _on_release(self, key):
         """按键释放事件"""
-        # 获取原始键名（不规范化）
-        raw_key_name = None
-        if key in KEY_TO_NAME:
-            raw_key_name = KEY_TO_NAME[key]
-        elif hasattr(key, 'char') and key.char:
-            raw_key_name = key.char.lower()
-        elif hasattr(key, 'name'):
-            raw_key_name = key.name.lower()
-
-        if not raw_key_name:
+        record = self._key_dispatch.get(key) or self._classify_key(key)
+        known, bit, is_main, _ = record
+        if not known:
             return
 
-        # 规范化后的键名
-        normalized_key_name = MODIFIER_NORMALIZE.get(raw_key_name, raw_key_name)
+        if is_main and self._main_key_pressed:
+            # 本次事件的时长和双击判断都使用同一次时钟读数
+            current_time = time.monotonic_ns()
+            press_duration = current_time - self._main_key_press_time
 
-        with self._lock:
-            # 检查是否释放的是主键
-            is_main_key_release = (raw_key_name == self._main_key or
-                                   normalized_key_name == self._main_key)
-
-            if is_main_key_release and self._main_key_pressed:
-                press_duration = time.time() - self._main_key_press_time
-
-                # 检查是否为有效触发
-                shortcut_matched = self._check_shortcut_match()
-
-                if (shortcut_matched and
-                    not self._other_key_pressed and
-                    self.MIN_PRESS_TIME <= press_duration <= self.MAX_PRESS_TIME):
-
-                    current_time = time.time()
-
-                    allow_double_click = self.double_click_callback is not None
-                    if allow_double_click and self.should_handle_double_click:
-                        try:
-                            allow_double_click = bool(self.should_handle_double_click())
-                        except Exception:
-                            allow_double_click = False
-
-                    # 仅当存在待执行单击时，才将当前点击识别为双击
-                    is_double_click = (
-                        allow_double_click and
-                        self._pending_single_click is not None and
-                        current_time - self._last_release_time <= DOUBLE_CLICK_INTERVAL
-                    )
-
-                    if is_double_click:
-                        # 双击检测：取消待执行的单击，执行双击回调
-                        if self._pending_single_click:
-                            self._pending_single_click.cancel()
-                            self._pending_single_click = None
-                        self._last_release_time = 0  # 重置，避免三击
-                        threading.Thread(target=self.double_click_callback, daemon=True).start()
-                    else:
-                        if self._pending_single_click:
-                            self._pending_single_click.cancel()
-                            self._pending_single_click = None
-
-                        if allow_double_click:
-                            # 可能是单击：延迟执行，等待看是否有双击
-                            self._last_release_time = current_time
-                            self._pending_single_click = threading.Timer(
-                                DOUBLE_CLICK_INTERVAL,
-                                self._execute_single_click
-                            )
-                            self._pending_single_click.start()
-                        else:
-                            # 当前状态不需要双击，直接执行单击回调
-                            self._last_release_time = 0
-                            self._trigger_single_click()
-
-                # 重置主键状态
-                self._main_key_pressed = False
-                self._main_key_press_time = 0
-                self._other_key_pressed = False
+            # 检查是否为有效触发
+            if (self._check_shortcut_match() and
+                not self._other_key_pressed and
+                self.MIN_PRESS_NS <= press_duration <= self.MAX_PRESS_NS):
+                self._handle_click(current_time)
 
-            # 更新修饰键状态
-            if raw_key_name in MODIFIER_KEYS or normalized_key_name in MODIFIER_KEYS:
-                self._pressed_modifiers.discard(normalized_key_name)
+            # 重置主键状态
+            self._main_key_pressed = False
+            self._main_key_press_time = 0
+            self._other_key_pressed = False
+
+        # 更新修饰键状态
+        if bit:
+            self._pressed_mask &= ~bit
+
+    def _handle_click(self, current_time: int):
+        """处理一次有效的快捷键点击：区分单击/双击"""
+        allow_double_click = self.double_click_callback is not None
+        if allow_double_click and self.should_handle_double_click:
+            try:
+                allow_double_click = bool(self.should_handle_double_click())
+            except Exception:
+                allow_double_click = False
 
-    def _execute_single_click(self):
-        """执行单击回调"""
         with self._lock:
-            self._pending_single_click = None
-            self._last_release_time = 0
-        self._trigger_single_click()
+            # 仅当存在待执行单击时，才将当前点击识别为双击
+            is_double_click = (
+                allow_double_click and
+                self._single_click_deadline != 0 and
+                current_time - self._last_release_time <= DOUBLE_CLICK_INTERVAL_NS
+            )
+
+            if is_double_click:
+                # 双击检测：取消待执行的单击，执行双击回调
+                self._cancel_single_click()
+                self._last_release_time = 0  # 重置，避免三击
+                self._callback_executor.submit(self.double_click_callback)
+            else:
+                self._cancel_single_click()
+
+                if allow_double_click:
+                    # 可能是单击：延迟执行，等待看是否有双击
+                    self._last_release_time = current_time
+                    self._single_click_deadline = current_time + DOUBLE_CLICK_INTERVAL_NS
+                    self._scheduler_cond.notify()
+                else:
+                    # 当前状态不需要双击，直接执行单击回调
+                    self._last_release_time = 0
+                    self._trigger_single_click()
+
+    def _cancel_single_click(self):
+        """取消待执行的单击（需持有 self._lock）"""
+        if self._single_click_deadline:
+            self._single_click_deadline = 0
+            self._scheduler_cond.notify()
+
+    def _scheduler_loop(self):
+        """调度线程：等到单击的触发时间仍未被双击取消时执行单击回调"""
+        while True:
+            with self._scheduler_cond:
+                while True:
+                    if self._scheduler_stopped:
+                        return
+                    deadline = self._single_click_deadline
+                    if not deadline:
+                        self._scheduler_cond.wait()
+                        continue
+                    remaining = deadline - time.monotonic_ns()
+                    if remaining <= 0:
+                        break
+                    self._scheduler_cond.wait(remaining / 1_000_000_000)
+                self._single_click_deadline = 0
+                self._last_release_time = 0
+            self._trigger_single_click()
 
     def _trigger_single_click(self):
         """异步触发单击回调"""
-        threading.Thread(target=self.callback, daemon=True).start()
+        self._callback_executor.submit(self.callback)
 
 
 # 保留旧的类名作为别名，保持向后兼容
@@ -503,6 +608,11 @@ RightCommandListener = KeyboardListener
 class ShortcutRecorder:
     """快捷键录制器 - 用于用户自定义快捷键"""
 
+    __slots__ = (
+        "on_recorded", "on_timeout", "on_cancel",
+        "_listener", "_recording", "_timeout_timer", "_lock",
+    )
+
     # 录制超时时间（秒）
     RECORD_TIMEOUT = 10
 
@@ -520,7 +630,7 @@ class ShortcutRecorder:
         self.on_recorded = on_recorded
         self.on_timeout = on_timeout
         self.on_cancel = on_cancel
-        self._listener: Optional[keyboard.Listener] = None
+        self._listener = None
         self._recording = False
         self._timeout_timer: Optional[threading.Timer] = None
         self._lock = threading.Lock()
@@ -537,6 +647,7 @@ class ShortcutRecorder:
         self._timeout_timer.start()
 
         # 启动键盘监听
+        keyboard = _get_keyboard()
         self._listener = keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release
@@ -562,7 +673,7 @@ class ShortcutRecorder:
         """超时处理"""
         self.stop()
         if self.on_timeout:
-            threading.Thread(target=self.on_timeout, daemon=True).start()
+            _RECORDER_CALLBACK_POOL.submit(self.on_timeout)
 
     def _on_press(self, key):
         """按键按下事件"""
@@ -575,32 +686,31 @@ class ShortcutRecorder:
                 return
 
         # 检查是否是 Escape 键（取消）
-        if key == keyboard.Key.esc:
+        if key == _get_keyboard().Key.esc:
             self.stop()
             if self.on_cancel:
-                threading.Thread(target=self.on_cancel, daemon=True).start()
+                _RECORDER_CALLBACK_POOL.submit(self.on_cancel)
             return
 
         # 检查是否是支持的快捷键
-        key_id = KEY_TO_NAME.get(key)
+        key_id = _get_key_to_name().get(key)
         if key_id:
             display_name = KEY_DISPLAY_NAMES.get(key_id, key_id)
             self.stop()
             if self.on_recorded:
-                threading.Thread(
-                    target=self.on_recorded,
-                    args=(key_id, display_name),
-                    daemon=True
-                ).start()
+                _RECORDER_CALLBACK_POOL.submit(self.on_recorded, key_id, display_name)
+
+
+# 当前平台可用的快捷键列表（内容固定，导入时生成一次）
+_AVAILABLE_SHORTCUTS = tuple(
+    {"key": key_id, "display": KEY_DISPLAY_NAMES.get(key_id, key_id)}
+    for key_id in SHORTCUT_KEY_MAP
+)
 
 
 def get_available_shortcuts() -> list:
-    """获取当前平台可用的快捷键列表"""
-    result = []
-    for key_id in SHORTCUT_KEY_MAP.keys():
-        display = KEY_DISPLAY_NAMES.get(key_id, key_id)
-        result.append({"key": key_id, "display": display})
-    return result
+    """获取当前平台可用的快捷键列表（调用方只读）"""
+    return list(_AVAILABLE_SHORTCUTS)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,10 @@ import threading
 from typing import Optional
 
 
+# 主屏幕尺寸，每个进程只查询一次
+_CACHED_SCREEN_FRAME = None
+
+
 if sys.platform == "darwin":
     from AppKit import (
         NSObject, NSWindow, NSWindowStyleMaskBorderless, NSBackingStoreBuffered,
@@ -53,17 +57,31 @@ if sys.platform == "darwin":
                 self._overlay._window.orderOut_(None)
 
         def performUpdate_(self, _):
+            # 先清除待更新标记再读取最新文字，之后到达的更新会重新派发
+            with self._overlay._update_lock:
+                self._overlay._update_pending = False
+                text = self._text
             if self._overlay._text_field:
-                self._overlay._text_field.setStringValue_(self._text)
+                self._overlay._text_field.setStringValue_(text)
 
 
 class OverlayWindow:
     """浮动文字窗口（macOS 实现）"""
 
+    __slots__ = (
+        "_window", "_text_field", "_initialized", "_last_text",
+        "_update_pending", "_update_lock", "_helper",
+    )
+
     def __init__(self):
         self._window = None
         self._text_field = None
         self._initialized = False
+        # 最近一次提交显示的文字，相同文字不再重复派发到主线程
+        self._last_text: Optional[str] = None
+        # 已派发但主线程尚未执行的更新：期间的多次更新合并，只渲染最新文字
+        self._update_pending = False
+        self._update_lock = threading.Lock()
         # 保持 helper 引用，防止被 GC
         self._helper = None
         if sys.platform == "darwin":
@@ -77,8 +95,10 @@ class OverlayWindow:
         if sys.platform != "darwin":
             return
 
-        screen = NSScreen.mainScreen()
-        screen_frame = screen.frame()
+        global _CACHED_SCREEN_FRAME
+        if _CACHED_SCREEN_FRAME is None:
+            _CACHED_SCREEN_FRAME = NSScreen.mainScreen().frame()
+        screen_frame = _CACHED_SCREEN_FRAME
 
         # 窗口尺寸和位置（屏幕底部中央）
         window_width = 600
@@ -136,7 +156,9 @@ class OverlayWindow:
         if sys.platform != "darwin" or not self._helper:
             return
 
-        self._helper._text = text
+        with self._update_lock:
+            self._helper._text = text
+            self._last_text = text
         self._helper.performSelectorOnMainThread_withObject_waitUntilDone_(
             "performShow:", None, False
         )
@@ -155,8 +177,15 @@ class OverlayWindow:
         """更新显示文字（线程安全）"""
         if sys.platform != "darwin" or not self._helper:
             return
+        with self._update_lock:
+            if text == self._last_text:
+                return
+            self._helper._text = text
+            self._last_text = text
+            if self._update_pending:
+                return
+            self._update_pending = True
 
-        self._helper._text = text
         self._helper.performSelectorOnMainThread_withObject_waitUntilDone_(
             "performUpdate:", None, False
         )
@@ -21,51 +21,45 @@ def get_platform_name() -> str:
         return "Unknown"
 
 
+# 当前平台的实现模块，首次使用时导入并缓存
+_impl = None
+
+
+def _get_impl():
+    """获取当前平台的实现模块（只执行一次导入）"""
+    global _impl
+    if _impl is None:
+        if IS_MACOS:
+            from . import macos as impl
+        elif IS_WINDOWS:
+            from . import windows as impl
+        else:
+            raise NotImplementedError(f"不支持的平台: {sys.platform}")
+        _impl = impl
+    return _impl
+
+
 def get_platform_app():
     """获取当前平台的应用类"""
-    if IS_MACOS:
-        from .macos import MacOSApp
-        return MacOSApp
-    elif IS_WINDOWS:
-        from .windows import WindowsApp
-        return WindowsApp
-    else:
-        raise NotImplementedError(f"不支持的平台: {sys.platform}")
+    impl = _get_impl()
+    return impl.MacOSApp if IS_MACOS else impl.WindowsApp
 
 
 def get_text_inputter():
     """获取当前平台的文本输入函数"""
-    if IS_MACOS:
-        from .macos import input_text
-        return input_text
-    elif IS_WINDOWS:
-        from .windows import input_text
-        return input_text
-    else:
-        raise NotImplementedError(f"不支持的平台: {sys.platform}")
+    return _get_impl().input_text
 
 
 def get_clipboard_reader():
     """获取当前平台的剪贴板读取函数"""
-    if IS_MACOS:
-        from .macos import read_clipboard
-        return read_clipboard
-    elif IS_WINDOWS:
-        from .windows import read_clipboard
-        return read_clipboard
-    else:
-        raise NotImplementedError(f"不支持的平台: {sys.platform}")
+    return _get_impl().read_clipboard
 
 
 def show_notification(title: str, subtitle: str, message: str, sound: bool = False):
     """显示系统通知"""
-    if IS_MACOS:
-        from .macos import show_notification as _show
-    elif IS_WINDOWS:
-        from .windows import show_notification as _show
-    else:
+    if not (IS_MACOS or IS_WINDOWS):
         # 回退：打印到控制台
         print(f"[通知] {title}: {message}")
         return
 
-    _show(title, subtitle, message, sound)
+    _get_impl().show_notification(title, subtitle, message, sound)
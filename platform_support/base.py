@@ -15,6 +15,8 @@ class AppState(Enum):
 
 class MenuItem:
     """菜单项"""
+    __slots__ = ("title", "callback", "enabled")
+
     def __init__(self, title: str, callback: Callable = None, enabled: bool = True):
         self.title = title
         self.callback = callback
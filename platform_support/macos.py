@@ -5,6 +5,7 @@ import os
 import time
 import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Callable, Optional
 
 # 隐藏 Dock 图标（必须在导入 rumps 之前设置）
@@ -23,13 +24,44 @@ from Quartz import (
 
 from .base import BasePlatformApp, AppState, MenuItem
 
+# 剪贴板写入和模拟粘贴在单独的单线程池中执行，保证按提交顺序输入
+_PASTE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="text-input")
+
+# V 键的虚拟键码
+V_KEY_CODE = 9
+
+# 预先创建 Command+V 的按下/释放事件，每次粘贴直接复用
+_PASTE_EVENT_DOWN = CGEventCreateKeyboardEvent(None, V_KEY_CODE, True)
+CGEventSetFlags(_PASTE_EVENT_DOWN, kCGEventFlagMaskCommand)
+_PASTE_EVENT_UP = CGEventCreateKeyboardEvent(None, V_KEY_CODE, False)
+CGEventSetFlags(_PASTE_EVENT_UP, kCGEventFlagMaskCommand)
+
+# 等待剪贴板写入生效的最长时间（秒）
+CLIPBOARD_COMMIT_TIMEOUT = 0.02
+
+# 超长文字分段粘贴：每段最大字符数，及段间间隔（秒，留时间给目标应用读取剪贴板）
+MAX_PASTE_CHUNK = 4096
+PASTE_CHUNK_INTERVAL = 0.05
+
+# 上次写入剪贴板的文字及写入后的 changeCount，用于跳过重复写入
+_last_clipboard = {"text": None, "change_count": -1}
+
+
+def _clipboard_has(pasteboard, text: str) -> bool:
+    """剪贴板是否仍是上次写入的同一段文字（期间没有其他程序修改过）"""
+    return text == _last_clipboard["text"] and pasteboard.changeCount() == _last_clipboard["change_count"]
+
 
 def copy_to_clipboard(text: str) -> bool:
-    """将文字复制到剪贴板"""
+    """将文字复制到剪贴板（内容未变化时跳过写入）"""
     try:
         pasteboard = NSPasteboard.generalPasteboard()
+        if _clipboard_has(pasteboard, text):
+            return True
         pasteboard.clearContents()
         pasteboard.setString_forType_(text, NSStringPboardType)
+        _last_clipboard["text"] = text
+        _last_clipboard["change_count"] = pasteboard.changeCount()
         return True
     except Exception as e:
         print(f"复制到剪贴板失败: {e}")
@@ -38,31 +70,67 @@ def copy_to_clipboard(text: str) -> bool:
 
 def simulate_paste():
     """模拟 Command+V 粘贴操作"""
-    V_KEY_CODE = 9
-    event_down = CGEventCreateKeyboardEvent(None, V_KEY_CODE, True)
-    CGEventSetFlags(event_down, kCGEventFlagMaskCommand)
-    CGEventPost(kCGHIDEventTap, event_down)
-    event_up = CGEventCreateKeyboardEvent(None, V_KEY_CODE, False)
-    CGEventSetFlags(event_up, kCGEventFlagMaskCommand)
-    CGEventPost(kCGHIDEventTap, event_up)
+    CGEventPost(kCGHIDEventTap, _PASTE_EVENT_DOWN)
+    CGEventPost(kCGHIDEventTap, _PASTE_EVENT_UP)
+
+
+def _paste_chunk(text: str) -> bool:
+    """复制一段文字并粘贴"""
+    pasteboard = NSPasteboard.generalPasteboard()
+    if not _clipboard_has(pasteboard, text):
+        before = pasteboard.changeCount()
+        if not copy_to_clipboard(text):
+            return False
+        # changeCount 递增即表示写入已生效，无需固定等待
+        deadline = time.monotonic() + CLIPBOARD_COMMIT_TIMEOUT
+        while pasteboard.changeCount() == before and time.monotonic() < deadline:
+            time.sleep(0.001)
+    simulate_paste()
+    return True
+
+
+def _input_text_sync(text: str) -> bool:
+    """将文字输入到当前窗口（在输入线程中执行，超长文字分段粘贴）"""
+    for start in range(0, len(text), MAX_PASTE_CHUNK):
+        if start:
+            time.sleep(PASTE_CHUNK_INTERVAL)
+        if not _paste_chunk(text[start:start + MAX_PASTE_CHUNK]):
+            return False
+    return True
+
+
+def _report_input_result(future):
+    """输入任务结束回调：失败时打印错误并通知用户"""
+    try:
+        if future.result():
+            return
+        message = "输入文字失败"
+    except Exception as e:
+        print(f"输入文字失败: {e}")
+        message = str(e)[:100]
+    show_notification(title="语音输入", subtitle="错误", message=message)
 
 
 def input_text(text: str) -> bool:
-    """将文字输入到当前窗口"""
+    """将文字输入到当前窗口
+
+    异步执行：只把文字提交到输入线程后立即返回，不阻塞调用方；
+    多次调用按顺序粘贴。返回值表示是否已提交，粘贴失败时通过系统通知提示。
+    """
     if not text:
         return False
-    if not copy_to_clipboard(text):
-        return False
-    time.sleep(0.05)
-    simulate_paste()
+    _PASTE_POOL.submit(_input_text_sync, text).add_done_callback(_report_input_result)
     return True
 
 
 def read_clipboard() -> str:
-    """读取剪贴板内容"""
-    import subprocess
-    result = subprocess.run(['pbpaste'], capture_output=True, text=True)
-    return result.stdout.strip()
+    """读取剪贴板内容（直接读取 NSPasteboard，不启动 pbpaste 子进程）"""
+    try:
+        pasteboard = NSPasteboard.generalPasteboard()
+        text = pasteboard.stringForType_(NSStringPboardType)
+        return (text or "").strip()
+    except Exception:
+        return ""
 
 
 def show_notification(title: str, subtitle: str, message: str, sound: bool = False):
@@ -82,6 +150,11 @@ class MacOSApp(BasePlatformApp):
         self._status_item: Optional[rumps.MenuItem] = None
         self._stats_item: Optional[rumps.MenuItem] = None
         self._record_item: Optional[rumps.MenuItem] = None
+        # 菜单位置到 rumps 菜单键的映射（分隔线为 None），构建菜单时生成
+        # rumps 以创建时的标题作为键，之后修改标题不会改变键
+        self._menu_keys: List[Optional[str]] = []
+        # 与 _menu_keys 对应的 rumps 菜单项对象，结构不变时直接复用
+        self._menu_objects: List[Optional[rumps.MenuItem]] = []
 
     def _create_rumps_app(self):
         """创建 rumps 应用"""
@@ -103,27 +176,57 @@ class MacOSApp(BasePlatformApp):
         if not self._rumps_app:
             return
 
+        # 重建时清空旧回调，避免残留已移除菜单项的回调
+        self._menu_callbacks = {}
+
+        # 菜单结构（标题和顺序）未变化时只更新回调和标题，避免整个 NSMenu 重建
+        titles = [item.title if item is not None else None for item in items]
+        if titles == self._menu_keys and self._menu_objects:
+            for item, menu_item in zip(items, self._menu_objects):
+                if item is None:
+                    continue
+                if menu_item.title != item.title:
+                    menu_item.title = item.title
+                self._bind_menu_callback(menu_item, item.callback)
+            return
+
         menu = []
-        for i, item in enumerate(items):
+        menu_keys = []
+        for item in items:
             if item is None:
                 menu.append(None)  # 分隔线
+                menu_keys.append(None)
             else:
                 menu_item = rumps.MenuItem(item.title)
-                if item.callback:
-                    self._menu_callbacks[i] = item.callback
-                    menu_item.set_callback(lambda sender, idx=i: self._menu_callbacks[idx](sender))
-                else:
-                    menu_item.set_callback(None)
+                self._bind_menu_callback(menu_item, item.callback)
                 menu.append(menu_item)
+                menu_keys.append(item.title)
 
         self._rumps_app.menu = menu
+        self._menu_keys = menu_keys
+        self._menu_objects = menu
+
+    def _bind_menu_callback(self, menu_item: rumps.MenuItem, callback: Optional[Callable]):
+        """绑定菜单项回调（统一经 _dispatch_menu_callback 分发）"""
+        if callback:
+            # rumps.MenuItem 不可哈希，以 id 作为键；标题可能被修改，不能用作键
+            self._menu_callbacks[id(menu_item)] = callback
+            menu_item.set_callback(self._dispatch_menu_callback)
+        else:
+            menu_item.set_callback(None)
+
+    def _dispatch_menu_callback(self, sender):
+        """统一分发菜单项回调"""
+        callback = self._menu_callbacks.get(id(sender))
+        if callback:
+            callback(sender)
 
     def update_menu_item(self, index: int, title: str = None, enabled: bool = None):
         """更新菜单项"""
-        if self._rumps_app and 0 <= index < len(self._rumps_app.menu):
-            keys = list(self._rumps_app.menu.keys())
-            if index < len(keys):
-                menu_item = self._rumps_app.menu[keys[index]]
+        if self._rumps_app and 0 <= index < len(self._menu_keys):
+            key = self._menu_keys[index]
+            if key is not None:
+                menu_item = self._rumps_app.menu[key]
                 if title is not None:
                     menu_item.title = title
                 # rumps 菜单项没有直接的 enabled 属性
@@ -168,13 +271,16 @@ class MacOSApp(BasePlatformApp):
 
         settings_item = rumps.MenuItem("设置...", callback=on_open_settings)
 
-        self._rumps_app.menu = [
+        menu = [
             self._status_item,
             self._stats_item,
             None,
             self._record_item,
             settings_item,
         ]
+        self._rumps_app.menu = menu
+        self._menu_keys = [item.title if item is not None else None for item in menu]
+        self._menu_objects = menu
 
     def set_state(self, new_state: AppState):
         """设置应用状态"""
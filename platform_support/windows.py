@@ -2,8 +2,11 @@
 Windows 平台实现 - 使用 pystray, pyperclip, pyautogui, plyer
 """
 import os
+import sys
 import time
+import ctypes
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Callable, Optional
 
 try:
@@ -18,11 +21,86 @@ except ImportError:
 
 from .base import BasePlatformApp, AppState, MenuItem
 
+# 剪贴板写入和模拟粘贴在单独的单线程池中执行，保证按提交顺序输入
+_PASTE_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="text-input")
+
+# SendInput 相关常量
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_V = 0x56
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+
+    ULONG_PTR = ctypes.c_size_t
+
+    class MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ULONG_PTR),
+        ]
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ULONG_PTR),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        # 包含 MOUSEINPUT 以保证联合体大小与系统定义一致
+        _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    def _key_input(vk: int, flags: int = 0) -> "INPUT":
+        return INPUT(type=INPUT_KEYBOARD, u=_INPUTUNION(ki=KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+    # Ctrl 按下、V 按下、V 释放、Ctrl 释放，一次 SendInput 提交
+    _PASTE_INPUTS = (INPUT * 4)(
+        _key_input(VK_CONTROL),
+        _key_input(VK_V),
+        _key_input(VK_V, KEYEVENTF_KEYUP),
+        _key_input(VK_CONTROL, KEYEVENTF_KEYUP),
+    )
+    _SendInput = ctypes.windll.user32.SendInput
+    _GetClipboardSequenceNumber = ctypes.windll.user32.GetClipboardSequenceNumber
+else:
+    _PASTE_INPUTS = None
+    _SendInput = None
+    _GetClipboardSequenceNumber = None
+
+# 菜单更新合并窗口（秒）：短时间内的多次状态变化只重建一次菜单
+MENU_UPDATE_DELAY = 0.05
+
+# 超长文字分段粘贴：每段最大字符数，及段间间隔（秒，留时间给目标应用读取剪贴板）
+MAX_PASTE_CHUNK = 4096
+PASTE_CHUNK_INTERVAL = 0.05
+
+# 上次写入剪贴板的文字及写入后的剪贴板序列号，用于跳过重复写入
+_last_clipboard = {"text": None, "sequence": -1}
+
 
 def copy_to_clipboard(text: str) -> bool:
-    """将文字复制到剪贴板"""
+    """将文字复制到剪贴板（内容未变化时跳过写入）"""
     try:
+        # 序列号未变说明期间没有其他程序修改过剪贴板
+        if (_GetClipboardSequenceNumber is not None
+                and text == _last_clipboard["text"]
+                and _GetClipboardSequenceNumber() == _last_clipboard["sequence"]):
+            return True
         pyperclip.copy(text)
+        if _GetClipboardSequenceNumber is not None:
+            _last_clipboard["text"] = text
+            _last_clipboard["sequence"] = _GetClipboardSequenceNumber()
         return True
     except Exception as e:
         print(f"复制到剪贴板失败: {e}")
@@ -30,21 +108,57 @@ def copy_to_clipboard(text: str) -> bool:
 
 
 def simulate_paste():
-    """模拟 Ctrl+V 粘贴操作"""
+    """模拟 Ctrl+V 粘贴操作（直接调用 SendInput，失败时回退到 pyautogui）"""
+    if _SendInput is not None:
+        sent = _SendInput(len(_PASTE_INPUTS), _PASTE_INPUTS, ctypes.sizeof(INPUT))
+        if sent == len(_PASTE_INPUTS):
+            return
     pyautogui.hotkey('ctrl', 'v')
 
 
-def input_text(text: str) -> bool:
-    """将文字输入到当前窗口"""
-    if not text:
-        return False
+def _paste_chunk(text: str) -> bool:
+    """复制一段文字并粘贴"""
+    # pyperclip.copy 在 CloseClipboard 返回后才结束，写入已生效，无需额外等待
     if not copy_to_clipboard(text):
         return False
-    time.sleep(0.05)
     simulate_paste()
     return True
 
 
+def _input_text_sync(text: str) -> bool:
+    """将文字输入到当前窗口（在输入线程中执行，超长文字分段粘贴）"""
+    for start in range(0, len(text), MAX_PASTE_CHUNK):
+        if start:
+            time.sleep(PASTE_CHUNK_INTERVAL)
+        if not _paste_chunk(text[start:start + MAX_PASTE_CHUNK]):
+            return False
+    return True
+
+
+def _report_input_result(future):
+    """输入任务结束回调：失败时打印错误并通知用户"""
+    try:
+        if future.result():
+            return
+        message = "输入文字失败"
+    except Exception as e:
+        print(f"输入文字失败: {e}")
+        message = str(e)[:100]
+    show_notification(title="语音输入", subtitle="错误", message=message)
+
+
+def input_text(text: str) -> bool:
+    """将文字输入到当前窗口
+
+    异步执行：只把文字提交到输入线程后立即返回，不阻塞调用方；
+    多次调用按顺序粘贴。返回值表示是否已提交，粘贴失败时通过系统通知提示。
+    """
+    if not text:
+        return False
+    _PASTE_POOL.submit(_input_text_sync, text).add_done_callback(_report_input_result)
+    return True
+
+
 def read_clipboard() -> str:
     """读取剪贴板内容"""
     try:
@@ -83,11 +197,20 @@ class WindowsApp(BasePlatformApp):
         self._on_toggle_recording: Optional[Callable] = None
         self._on_open_settings: Optional[Callable] = None
         self._running = False
+        self._last_menu_sig = None
+        self._menu_timer: Optional[threading.Timer] = None
+        self._menu_lock = threading.Lock()
+        # 预先解码空闲/录音图标，状态切换时直接复用
+        self._icon_images = {
+            path: self._load_icon(path) for path in (icon_idle, icon_recording)
+        }
 
     def _load_icon(self, icon_path: str) -> Image.Image:
-        """加载图标文件"""
+        """加载图标文件（立即解码）"""
         if os.path.exists(icon_path):
-            return Image.open(icon_path)
+            image = Image.open(icon_path)
+            image.load()
+            return image
         # 创建默认图标
         img = Image.new('RGB', (64, 64), color='gray')
         return img
@@ -111,14 +234,33 @@ class WindowsApp(BasePlatformApp):
         )
 
     def _update_menu(self):
-        """更新菜单（需要重建）"""
-        if self._icon:
-            self._icon.menu = self._create_menu()
+        """请求更新菜单（合并短时间内的多次请求，只重建一次）"""
+        with self._menu_lock:
+            if self._menu_timer is not None:
+                self._menu_timer.cancel()
+            self._menu_timer = threading.Timer(MENU_UPDATE_DELAY, self._rebuild_menu)
+            self._menu_timer.daemon = True
+            self._menu_timer.start()
+
+    def _rebuild_menu(self):
+        """重建菜单（文字未变化时跳过）"""
+        with self._menu_lock:
+            self._menu_timer = None
+        if not self._icon:
+            return
+        sig = (self._status_text, self._stats_text, self._record_text)
+        if sig == self._last_menu_sig:
+            return
+        self._last_menu_sig = sig
+        self._icon.menu = self._create_menu()
 
     def set_icon(self, icon_path: str):
         """设置托盘图标"""
         if self._icon:
-            self._icon.icon = self._load_icon(icon_path)
+            image = self._icon_images.get(icon_path)
+            if image is None:
+                image = self._icon_images[icon_path] = self._load_icon(icon_path)
+            self._icon.icon = image
 
     def set_menu(self, items: List[MenuItem]):
         """设置菜单项"""
@@ -183,7 +325,8 @@ class WindowsApp(BasePlatformApp):
     def run(self):
         """启动应用"""
         self._running = True
-        icon_image = self._load_icon(self.icon_idle)
+        icon_image = self._icon_images[self.icon_idle]
+        self._last_menu_sig = (self._status_text, self._stats_text, self._record_text)
         self._icon = pystray.Icon(
             name=self.name,
             icon=icon_image,
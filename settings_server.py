@@ -1,18 +1,40 @@
 """
 设置服务 - 基于 FastAPI 的 Web 设置界面
 """
+import importlib.util
 import os
+import time
 from pathlib import Path
 from typing import Optional
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import HTMLResponse, FileResponse
+from starlette.concurrency import run_in_threadpool
+
+# orjson 可用时使用更快的 JSON 响应（ORJSONResponse 在响应时才导入 orjson，这里只检查是否安装）
+if importlib.util.find_spec("orjson") is not None:
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+else:
+    from fastapi.responses import JSONResponse as DefaultJSONResponse
 from pydantic import BaseModel
-import sounddevice as sd
 
 from config_manager import get_config, get_history_manager
 from keyboard_listener import get_available_shortcuts
 
-app = FastAPI(title="语音输入设置")
+app = FastAPI(title="语音输入设置", default_response_class=DefaultJSONResponse)
+
+# 麦克风列表缓存有效期（秒），设备变化不频繁，避免每次请求都扫描 PortAudio 设备
+MICROPHONE_CACHE_TTL = 30
+
+# LLM 测试请求超时（秒），避免接口无响应时长时间占用服务
+LLM_TEST_TIMEOUT = 10
+
+# OpenAI 客户端缓存：{(api_key, base_url): client}，复用连接避免每次重新握手
+_llm_clients: dict = {}
+
+# 配置响应缓存：(配置版本号, 响应内容)
+_config_cache: Optional[tuple] = None
+# 麦克风列表缓存：(获取时间, 设备列表)
+_microphones_cache: Optional[tuple] = None
 
 # 模板目录
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -44,6 +66,9 @@ class LLMConfig(BaseModel):
     context_window_size: Optional[int] = None
     context_history_ttl: Optional[int] = None
     context_correction_prompt: Optional[str] = None
+    fused_correction: Optional[bool] = None
+    parallel_correction: Optional[bool] = None
+    skip_clean_correction: Optional[bool] = None
 
 
 class RecordingConfig(BaseModel):
@@ -65,49 +90,66 @@ class ConfigUpdate(BaseModel):
     recording: Optional[RecordingConfig] = None
 
 
+# 请求字段到 ConfigManager 属性名的映射：{分区: {字段: 属性}}
+_CONFIG_FIELD_MAP = {
+    "asr": {
+        "provider": "asr_provider",
+        "api_key": "asr_api_key",
+        "model": "asr_model",
+        "volcengine_app_key": "volcengine_app_key",
+        "volcengine_access_key": "volcengine_access_key",
+    },
+    "llm": {
+        "api_key": "llm_api_key",
+        "provider": "llm_provider",
+        "model": "llm_model",
+        "correction_enabled": "llm_correction_enabled",
+        "correction_prompt": "llm_correction_prompt",
+        "context_correction_enabled": "context_correction_enabled",
+        "context_window_size": "context_window_size",
+        "context_history_ttl": "context_history_ttl",
+        "context_correction_prompt": "context_correction_prompt",
+        "fused_correction": "fused_correction_enabled",
+        "parallel_correction": "parallel_correction_enabled",
+        "skip_clean_correction": "skip_clean_correction_enabled",
+    },
+    "recording": {
+        "max_duration": "recording_max_duration",
+        "silence_timeout": "recording_silence_timeout",
+    },
+}
+
+
 @app.get("/settings", response_class=HTMLResponse)
 async def settings_page():
     """返回设置页面 HTML"""
     html_path = TEMPLATE_DIR / "settings.html"
     if html_path.exists():
-        return html_path.read_text(encoding="utf-8")
-    return "<h1>设置页面未找到</h1>"
+        # FileResponse 直接发送文件并带上 ETag / Last-Modified，浏览器可走缓存
+        return FileResponse(html_path, media_type="text/html; charset=utf-8")
+    return HTMLResponse("<h1>设置页面未找到</h1>")
 
 
-@app.get("/api/config")
-async def get_config_api():
-    """获取当前配置"""
-    config = get_config()
+def _mask_key(key: Optional[str]) -> str:
+    """部分隐藏密钥，只保留首尾各 4 位"""
+    if key and len(key) > 8:
+        return key[:4] + "*" * (len(key) - 8) + key[-4:]
+    return ""
 
-    # API Key 部分隐藏
-    api_key = config.asr_api_key
-    if api_key and len(api_key) > 8:
-        masked_key = api_key[:4] + "*" * (len(api_key) - 8) + api_key[-4:]
-    else:
-        masked_key = ""
 
-    # 火山引擎 App Key 部分隐藏
-    volc_app_key = config.volcengine_app_key
-    if volc_app_key and len(volc_app_key) > 8:
-        masked_volc_app_key = volc_app_key[:4] + "*" * (len(volc_app_key) - 8) + volc_app_key[-4:]
-    else:
-        masked_volc_app_key = ""
+def _build_config_response(config) -> dict:
+    """构建配置响应（不含历史消息），按配置版本号缓存"""
+    global _config_cache
+    version = config.version
+    if _config_cache is not None and _config_cache[0] == version:
+        return _config_cache[1]
 
-    # 火山引擎 Access Key 部分隐藏
+    api_key = config.asr_api_key
+    volc_app_key = config.volcengine_app_key
     volc_access_key = config.volcengine_access_key
-    if volc_access_key and len(volc_access_key) > 8:
-        masked_volc_access_key = volc_access_key[:4] + "*" * (len(volc_access_key) - 8) + volc_access_key[-4:]
-    else:
-        masked_volc_access_key = ""
-
-    # LLM API Key 部分隐藏
     llm_api_key = config.llm_api_key
-    if llm_api_key and len(llm_api_key) > 8:
-        masked_llm_key = llm_api_key[:4] + "*" * (len(llm_api_key) - 8) + llm_api_key[-4:]
-    else:
-        masked_llm_key = ""
 
-    return {
+    response = {
         "shortcut": {
             "key": config.shortcut_key,
             "display": config.shortcut_display
@@ -122,16 +164,16 @@ async def get_config_api():
         },
         "asr": {
             "provider": config.asr_provider,
-            "api_key": masked_key,
+            "api_key": _mask_key(api_key),
             "api_key_set": bool(api_key),
             "model": config.asr_model,
-            "volcengine_app_key": masked_volc_app_key,
+            "volcengine_app_key": _mask_key(volc_app_key),
             "volcengine_app_key_set": bool(volc_app_key),
-            "volcengine_access_key": masked_volc_access_key,
+            "volcengine_access_key": _mask_key(volc_access_key),
             "volcengine_access_key_set": bool(volc_access_key),
         },
         "llm": {
-            "api_key": masked_llm_key,
+            "api_key": _mask_key(llm_api_key),
             "api_key_set": bool(llm_api_key),
             "provider": config.llm_provider,
             "model": config.llm_model,
@@ -140,8 +182,23 @@ async def get_config_api():
             "context_correction_enabled": config.context_correction_enabled,
             "context_window_size": config.context_window_size,
             "context_history_ttl": config.context_history_ttl,
-            "context_correction_prompt": config.context_correction_prompt
+            "context_correction_prompt": config.context_correction_prompt,
+            "fused_correction": config.fused_correction_enabled,
+            "parallel_correction": config.parallel_correction_enabled,
+            "skip_clean_correction": config.skip_clean_correction_enabled
         },
+    }
+    _config_cache = (version, response)
+    return response
+
+
+@app.get("/api/config")
+async def get_config_api():
+    """获取当前配置"""
+    config = get_config()
+    # 历史消息独立于配置变化，每次单独获取
+    return {
+        **_build_config_response(config),
         "context_history": get_history_manager().get_recent(config.context_window_size)
     }
 
@@ -151,49 +208,25 @@ async def save_config_api(data: ConfigUpdate):
     """保存配置"""
     config = get_config()
 
-    if data.microphone:
-        config.set_microphone(
-            device_id=data.microphone.device_id,
-            device_name=data.microphone.device_name
-        )
-
-    if data.asr:
-        if data.asr.provider is not None:
-            config.asr_provider = data.asr.provider
-        if data.asr.api_key is not None:
-            config.asr_api_key = data.asr.api_key
-        if data.asr.model is not None:
-            config.asr_model = data.asr.model
-        if data.asr.volcengine_app_key is not None:
-            config.volcengine_app_key = data.asr.volcengine_app_key
-        if data.asr.volcengine_access_key is not None:
-            config.volcengine_access_key = data.asr.volcengine_access_key
-
-    if data.llm:
-        if data.llm.api_key is not None:
-            config.llm_api_key = data.llm.api_key
-        if data.llm.provider is not None:
-            config.llm_provider = data.llm.provider
-        if data.llm.model is not None:
-            config.llm_model = data.llm.model
-        if data.llm.correction_enabled is not None:
-            config.llm_correction_enabled = data.llm.correction_enabled
-        if data.llm.correction_prompt is not None:
-            config.llm_correction_prompt = data.llm.correction_prompt
-        if data.llm.context_correction_enabled is not None:
-            config.context_correction_enabled = data.llm.context_correction_enabled
-        if data.llm.context_window_size is not None:
-            config.context_window_size = data.llm.context_window_size
-        if data.llm.context_history_ttl is not None:
-            config.context_history_ttl = data.llm.context_history_ttl
-        if data.llm.context_correction_prompt is not None:
-            config.context_correction_prompt = data.llm.context_correction_prompt
-
-    if data.recording:
-        if data.recording.max_duration is not None:
-            config.recording_max_duration = data.recording.max_duration
-        if data.recording.silence_timeout is not None:
-            config.recording_silence_timeout = data.recording.silence_timeout
+    # 只取客户端实际提交的字段
+    updates = data.model_dump(exclude_unset=True)
+
+    # 批量修改，只写一次配置文件
+    with config.batch():
+        if updates.pop("microphone", None) is not None:
+            config.set_microphone(
+                device_id=data.microphone.device_id,
+                device_name=data.microphone.device_name
+            )
+
+        for section, fields in updates.items():
+            if not fields:
+                continue
+            attrs = _CONFIG_FIELD_MAP[section]
+            for field, value in fields.items():
+                # 这些配置项都不接受空值，显式传 null 视为不修改
+                if value is not None:
+                    setattr(config, attrs[field], value)
 
     return {"status": "ok"}
 
@@ -207,20 +240,21 @@ async def test_llm_api():
     if not api_key:
         return {"success": False, "message": "未设置 API Key"}
 
-    # 根据 provider 获取 base_url
-    provider = config.llm_provider
-    if provider == "deepseek":
-        base_url = "https://api.deepseek.com"
-    else:
-        base_url = "https://api.deepseek.com"
+    base_url = config.llm_base_url
 
     try:
-        from openai import OpenAI
-
-        client = OpenAI(
-            api_key=api_key,
-            base_url=base_url
-        )
+        client_key = (api_key, base_url)
+        client = _llm_clients.get(client_key)
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                timeout=LLM_TEST_TIMEOUT,
+                max_retries=0
+            )
+            _llm_clients[client_key] = client
 
         # 发送简单测试请求
         completion = client.chat.completions.create(
@@ -280,7 +314,9 @@ async def get_context_history():
 async def update_context_history(timestamp: str, data: ContextHistoryUpdate):
     """编辑指定历史消息（使用 timestamp 作为标识）"""
     history_mgr = get_history_manager()
-    history_mgr.update(timestamp, data.text)
+    # 按时间戳索引直接定位，不存在时立即返回 404
+    if not history_mgr.update(timestamp, data.text):
+        raise HTTPException(status_code=404, detail="消息不存在")
     return {"status": "ok"}
 
 
@@ -288,7 +324,8 @@ async def update_context_history(timestamp: str, data: ContextHistoryUpdate):
 async def delete_context_history_item(timestamp: str):
     """删除指定历史消息（使用 timestamp 作为标识）"""
     history_mgr = get_history_manager()
-    history_mgr.delete(timestamp)
+    if not history_mgr.delete(timestamp):
+        raise HTTPException(status_code=404, detail="消息不存在")
     return {"status": "ok"}
 
 
@@ -334,9 +371,9 @@ async def set_shortcut(data: ShortcutConfig):
     return {"status": "ok"}
 
 
-@app.get("/api/microphones")
-async def get_microphones():
-    """获取麦克风列表"""
+def _refresh_microphones() -> list:
+    """枚举输入设备并刷新缓存（同步执行，可能耗时数十毫秒）"""
+    global _microphones_cache
     devices = []
 
     # 添加「自动」选项
@@ -345,8 +382,9 @@ async def get_microphones():
         "name": "自动（跟随系统）"
     })
 
-    # 获取输入设备列表
+    # 获取输入设备列表（sounddevice 会加载 PortAudio，只在需要时导入）
     try:
+        import sounddevice as sd
         all_devices = sd.query_devices()
         for i, device in enumerate(all_devices):
             if device['max_input_channels'] > 0:
@@ -357,13 +395,24 @@ async def get_microphones():
     except Exception:
         pass
 
+    _microphones_cache = (time.monotonic(), devices)
     return devices
 
 
+@app.get("/api/microphones")
+async def get_microphones():
+    """获取麦克风列表（缓存 MICROPHONE_CACHE_TTL 秒）"""
+    cache = _microphones_cache
+    if cache is not None and time.monotonic() - cache[0] < MICROPHONE_CACHE_TTL:
+        return cache[1]
+    # 设备枚举是阻塞调用，放到线程池执行，不阻塞事件循环
+    return await run_in_threadpool(_refresh_microphones)
+
+
 def run_server(host: str = "127.0.0.1", port: int = 18321):
     """运行设置服务"""
     import uvicorn
-    uvicorn.run(app, host=host, port=port, log_level="warning")
+    uvicorn.run(app, host=host, port=port, log_level="warning", access_log=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+"""
+Ogg 封装测试 - 校验页结构和 CRC
+"""
+import os
+import struct
+import unittest
+
+import numpy as np
+
+from audio_recorder import (
+    OPUS_AVAILABLE, OPUS_PRE_SKIP, SAMPLE_RATE,
+    _ogg_crc, _ogg_page, encode_ogg_opus,
+)
+
+
+def _reference_crc(data: bytes) -> int:
+    """逐位计算的 Ogg CRC（多项式 0x04C11DB7，初值 0，不反转，不异或）"""
+    crc = 0
+    for b in data:
+        crc ^= b << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else (crc << 1)
+            crc &= 0xFFFFFFFF
+    return crc
+
+
+def _parse_pages(data: bytes) -> list:
+    """把 Ogg 数据拆分为页，校验每页 CRC，返回 (header_type, granule, serial, seq, packets) 列表"""
+    pages = []
+    pos = 0
+    while pos < len(data):
+        capture, version, header_type, granule, serial, seq, crc, n_segments = \
+            struct.unpack_from("<4sBBqIIIB", data, pos)
+        assert capture == b"OggS" and version == 0
+        lacing = data[pos + 27:pos + 27 + n_segments]
+        body_start = pos + 27 + n_segments
+        end = body_start + sum(lacing)
+
+        page = bytearray(data[pos:end])
+        page[22:26] = b"\x00\x00\x00\x00"
+        assert _reference_crc(bytes(page)) == crc
+
+        packets = []
+        packet = bytearray()
+        offset = body_start
+        for size in lacing:
+            packet += data[offset:offset + size]
+            offset += size
+            if size < 255:
+                packets.append(bytes(packet))
+                packet = bytearray()
+        pages.append((header_type, granule, serial, seq, packets))
+        pos = end
+    return pages
+
+
+class OggCrcTest(unittest.TestCase):
+
+    def test_check_value(self):
+        # CRC-32/POSIX 的校验值 0x765E7680 去掉结果异或
+        self.assertEqual(_ogg_crc(b"123456789"), 0x765E7680 ^ 0xFFFFFFFF)
+
+    def test_matches_reference(self):
+        for size in (0, 1, 3, 255, 4096):
+            data = os.urandom(size)
+            self.assertEqual(_ogg_crc(data), _reference_crc(data))
+
+
+class OggPageTest(unittest.TestCase):
+
+    def test_page_structure(self):
+        packets = [b"a" * 10, b"b" * 255, b"c" * 600]
+        page = _ogg_page(packets, granule=1234, serial=42, seq=7, header_type=0x04)
+
+        parsed = _parse_pages(page)
+        self.assertEqual(len(parsed), 1)
+        header_type, granule, serial, seq, parsed_packets = parsed[0]
+        self.assertEqual((header_type, granule, serial, seq), (0x04, 1234, 42, 7))
+        self.assertEqual(parsed_packets, packets)
+        # 255 字节的包需要额外的 0 长度分段表示结束
+        self.assertEqual(page[26], 1 + 2 + 3)
+
+
+@unittest.skipUnless(OPUS_AVAILABLE, "未安装 opuslib")
+class EncodeOggOpusTest(unittest.TestCase):
+
+    def test_stream_structure(self):
+        t = np.arange(SAMPLE_RATE * 2) / SAMPLE_RATE
+        audio = (np.sin(2 * np.pi * 440 * t) * 8000).astype(np.int16).reshape(-1, 1)
+
+        pages = _parse_pages(encode_ogg_opus(audio, SAMPLE_RATE))
+
+        self.assertGreaterEqual(len(pages), 3)
+        self.assertEqual(pages[0][0], 0x02)  # BOS
+        self.assertEqual(pages[-1][0], 0x04)  # EOS
+        self.assertEqual([p[3] for p in pages], list(range(len(pages))))
+        self.assertEqual(len({p[2] for p in pages}), 1)
+        self.assertTrue(pages[0][4][0].startswith(b"OpusHead"))
+        self.assertTrue(pages[1][4][0].startswith(b"OpusTags"))
+
+        granules = [p[1] for p in pages[2:]]
+        self.assertEqual(granules, sorted(granules))
+        scale = 48000 // SAMPLE_RATE
+        self.assertEqual(granules[-1], OPUS_PRE_SKIP + len(audio) * scale)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,20 +6,112 @@
 """
 import os
 import sys
+import re
+import hashlib
 import threading
-import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
 
-from openai import OpenAI
+import numpy as np
 
 from keyboard_listener import KeyboardListener, get_default_shortcut
-from audio_recorder import AudioRecorder, audio_to_base64
+from audio_recorder import AudioRecorder, OPUS_AVAILABLE, audio_to_data_url, audio_to_opus_data_url
 from config_manager import get_config, get_history_manager
-from platform_support import IS_MACOS, IS_WINDOWS, get_platform_app, show_notification
+from platform_support import (
+    IS_MACOS, IS_WINDOWS, get_platform_app, show_notification,
+    get_clipboard_reader, get_text_inputter,
+)
 from platform_support.base import AppState
 from overlay_window import OverlayWindow
 
+# watchdog 为可选依赖，用于监听配置文件变化
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 # 设置服务端口
 SETTINGS_PORT = 18321
+# 首次打开设置时等待设置服务就绪的最长时间（秒）
+SETTINGS_STARTUP_TIMEOUT = 5
+# 统计显示刷新的合并窗口（秒），连续多次识别只刷新一次
+STATS_UPDATE_DELAY = 0.2
+
+# ASR 结果缓存条数（按音频内容哈希，同一段音频重复识别时直接返回）
+ASR_CACHE_SIZE = 256
+# LLM 纠错结果缓存条数（按模型、提示词和输入文字哈希）
+LLM_CACHE_SIZE = 512
+
+# 纠错跳过规则（需在配置中开启）：不超过此长度且只含常用汉字和中文标点的文字视为无需 LLM 纠错
+CLEAN_TEXT_MAX_LEN = 8
+_CLEAN_TEXT_RE = re.compile(r"[\u4e00-\u9fff，。？！、]+")
+# 纠错跳过规则（需在配置中开启）：不超过此长度的文字不做上下文纠错
+CONTEXT_MIN_LEN = 4
+
+# 上下文纠错提示词中当前文字的占位符（含 NUL，不会出现在正常文字中）
+_CURRENT_PLACEHOLDER = "\x00current\x00"
+
+# ASR 请求的固定附加参数（只读，所有请求共用同一对象）
+_ASR_EXTRA_BODY = {"asr_options": {"enable_itn": False}}
+
+# 在等待 ASR 结果期间预取上下文历史（读取历史文件）
+_CONTEXT_PREFETCH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="context-prefetch")
+# 并发纠错时上下文纠错请求所在线程（任务内不等待其他任务，不会互相阻塞）
+_CONTEXT_CORRECTION_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="context-correction")
+
+
+class _LRUCache:
+    """线程安全的简单 LRU 缓存"""
+
+    __slots__ = ("_data", "_lock", "_maxsize")
+
+    def __init__(self, maxsize: int):
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+
+    def get(self, key):
+        """读取缓存，命中时标记为最近使用；未命中返回 None"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """写入缓存，超出容量时淘汰最久未用的条目"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._data.clear()
+
+
+def _is_likely_clean(text: str) -> bool:
+    """短且只含常用汉字和中文标点（无数字、英文、生僻字区）的文字，纠错几乎不会有改动"""
+    return len(text) <= CLEAN_TEXT_MAX_LEN and _CLEAN_TEXT_RE.fullmatch(text) is not None
+
+
+def _text_digest(*parts: str) -> bytes:
+    """计算若干段文字的哈希，用作缓存键"""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        data = part.encode("utf-8")
+        # 带上长度，避免不同切分拼出相同的字节串
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.digest()
 
 
 class VoiceInputApp:
@@ -35,12 +127,30 @@ class VoiceInputApp:
 
         # 配置
         self.config = get_config()
+        # 历史管理器是全局单例，只获取一次
+        self.history_mgr = get_history_manager()
         self._config_mtime = 0
+        # LLM 接口地址在加载配置时解析一次
+        self._llm_base_url = self.config.llm_base_url
+        self._config_observer = None
+
+        # 批处理识别线程池：复用工作线程，多次识别按顺序执行
+        self._recognize_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="asr")
+        # 自动停止、流式收尾等后台任务的线程池，避免每次事件都新建线程
+        self._worker = ThreadPoolExecutor(max_workers=2, thread_name_prefix="voice-input")
+
+        # 统计显示由后台线程合并刷新，不占用识别线程
+        self._stats_dirty = threading.Event()
+
+        # 设置服务在首次打开设置页时才启动（fastapi/uvicorn 导入较慢）
+        self._settings_server_started = False
+        self._settings_server_lock = threading.Lock()
 
         # 运行标志
         self._running = True
 
-        # 状态
+        # 状态：写入经 _set_state 加锁（保证与界面更新顺序一致），
+        # 读取直接读属性（引用赋值在 GIL 下是原子的，最多读到刚被替换的旧值）
         self.state = AppState.IDLE
         self._state_lock = threading.Lock()
 
@@ -50,9 +160,25 @@ class VoiceInputApp:
         # 流式识别相关
         self._streaming_asr = None
         self._streaming_lock = threading.Lock()  # 保护 _streaming_asr 的并发访问
-        self._streaming_last_text = ""  # 追踪流式识别最新文字
-        self._streaming_text_lock = threading.Lock()
+        # 追踪流式识别最新文字：只做整体引用替换（GIL 下是原子操作），读写都无需加锁
+        self._streaming_last_text = ""
         self._overlay = OverlayWindow()
+        # 流式识别错误类型前缀 -> 处理方法
+        self._streaming_error_handlers = {
+            "BUFFER_FULL_AUTO_STOP": self._on_buffer_full,
+            "BUFFER_WARNING": self._on_buffer_warning,
+        }
+
+        # ASR 结果缓存：{(接口, 模型, 音频哈希): 识别文字}
+        self._asr_cache = _LRUCache(ASR_CACHE_SIZE)
+        # LLM 纠错结果缓存：{(接口, 模型, 提示词和文字哈希): 纠错结果}，配置重新加载时清空
+        self._llm_cache = _LRUCache(LLM_CACHE_SIZE)
+        # 上下文纠错提示词缓存：((模板, 历史消息), 已填入历史的模板)
+        self._context_prompt_cache: Optional[tuple] = None
+
+        # OpenAI 客户端缓存：{(api_key, base_url): client}，复用连接池避免每次重新握手
+        self._clients = {}
+        self._clients_lock = threading.Lock()
 
         # 键盘监听器
         self.keyboard_listener = KeyboardListener(
@@ -62,6 +188,10 @@ class VoiceInputApp:
             should_handle_double_click=self._can_handle_double_click
         )
 
+        # 平台的文字输入和剪贴板读取函数只解析一次
+        self._input_text = get_text_inputter()
+        self._read_clipboard = get_clipboard_reader()
+
         # 创建平台应用
         PlatformApp = get_platform_app()
         self.platform_app = PlatformApp(
@@ -75,6 +205,8 @@ class VoiceInputApp:
         """退出回调"""
         self._running = False
         self.keyboard_listener.stop()
+        self._stop_config_watcher()
+        self._worker.shutdown(wait=False, cancel_futures=True)
         # 确保录音器和流式 ASR 被清理
         try:
             self.recorder.stop()
@@ -88,17 +220,34 @@ class VoiceInputApp:
                 streaming_asr.stop()
             except Exception:
                 pass
+        # 托盘退出可能直接结束进程而不执行 atexit，这里先把缓冲的历史记录落盘
+        self.history_mgr.close()
 
     def _update_stats_display(self):
         """更新统计显示"""
-        history_mgr = get_history_manager()
-        stats = history_mgr.get_stats()
-        today_stats = history_mgr.get_today_stats()
+        stats = self.history_mgr.get_stats()
+        today_stats = self.history_mgr.get_today_stats()
 
         today_chars = today_stats.get("today_chars", 0)
         total_chars = stats.get("total_chars", 0)
         self.platform_app.update_stats(today_chars, total_chars)
 
+    def _request_stats_update(self):
+        """请求刷新统计显示（异步、合并短时间内的多次请求）"""
+        self._stats_dirty.set()
+
+    def _stats_update_loop(self):
+        """统计刷新线程：收到请求后稍等片刻再统一刷新"""
+        import time
+        while self._running:
+            self._stats_dirty.wait()
+            time.sleep(STATS_UPDATE_DELAY)
+            self._stats_dirty.clear()
+            try:
+                self._update_stats_display()
+            except Exception:
+                pass
+
     def _set_state(self, new_state: AppState):
         """设置应用状态"""
         with self._state_lock:
@@ -111,8 +260,7 @@ class VoiceInputApp:
 
     def _on_shortcut(self):
         """快捷键回调"""
-        with self._state_lock:
-            current_state = self.state
+        current_state = self.state
 
         # 自愈：状态显示为录音中，但录音器已经不在录音时，先回到空闲状态
         if current_state == AppState.RECORDING and not self.recorder.is_recording():
@@ -126,30 +274,25 @@ class VoiceInputApp:
 
     def _can_handle_double_click(self) -> bool:
         """仅在空闲状态下启用双击功能"""
-        with self._state_lock:
-            return self.state == AppState.IDLE
+        return self.state == AppState.IDLE
 
     def _on_double_click(self):
         """双击快捷键回调 - 用剪贴板更新最新历史"""
-        with self._state_lock:
-            if self.state != AppState.IDLE:
-                return
+        if self.state != AppState.IDLE:
+            return
 
-        # 读取剪贴板
-        from platform_support import get_clipboard_reader
-        read_clipboard = get_clipboard_reader()
-        clipboard_text = read_clipboard()
+        # 读取剪贴板（macOS 直接读取 NSPasteboard，不启动 pbpaste 子进程）
+        clipboard_text = self._read_clipboard()
 
         if not clipboard_text:
             self.platform_app.show_notification("语音输入", "", "剪贴板为空", sound=False)
             return
 
         # 更新最新历史
-        history_mgr = get_history_manager()
-        recent = history_mgr.get_recent(1)
+        recent = self.history_mgr.get_recent(1)
         if recent:
-            history_mgr.update(recent[0]["timestamp"], clipboard_text, is_manual=True)
-            self._update_stats_display()
+            self.history_mgr.update(recent[0]["timestamp"], clipboard_text, is_manual=True)
+            self._request_stats_update()
             self.platform_app.show_notification("语音输入", "", "已更新最新历史", sound=False)
         else:
             self.platform_app.show_notification("语音输入", "", "暂无历史消息", sound=False)
@@ -204,8 +347,7 @@ class VoiceInputApp:
                 self._streaming_asr = asr
 
             # 重置流式识别文字追踪
-            with self._streaming_text_lock:
-                self._streaming_last_text = ""
+            self._streaming_last_text = ""
 
             # 显示浮动窗口
             self._overlay.show("正在聆听...")
@@ -220,7 +362,7 @@ class VoiceInputApp:
         except Exception as e:
             if asr:
                 # recorder.start 失败时，asr 线程可能已启动，异步收尾避免会话泄漏
-                threading.Thread(target=asr.stop, daemon=True).start()
+                self._worker.submit(asr.stop)
             with self._streaming_lock:
                 self._streaming_asr = None
             self._overlay.hide()
@@ -233,74 +375,74 @@ class VoiceInputApp:
             )
 
     def _on_streaming_partial(self, text: str):
-        """流式识别中间结果回调"""
+        """流式识别中间结果回调
+
+        只记录最新文字并交给浮动窗口；浮动窗口会合并短时间内的多次更新，
+        主线程每次只绘制最新的一条。
+        """
         if text:
-            with self._streaming_text_lock:
-                self._streaming_last_text = text
+            self._streaming_last_text = text
         self._overlay.update_text(text if text else "正在聆听...")
 
     def _on_streaming_final(self, text: str):
         """流式识别最终结果回调"""
         if text:
-            with self._streaming_text_lock:
-                self._streaming_last_text = text
+            self._streaming_last_text = text
             self._overlay.update_text(text)
 
     def _on_streaming_error(self, msg: str):
-        """流式识别错误回调"""
-        # 解析错误类型
-        error_type = "UNKNOWN"
-        error_message = msg
-
-        if msg.startswith("BUFFER_FULL_AUTO_STOP:"):
-            error_type = "BUFFER_FULL"
-            error_message = msg.split(":", 1)[1] if ":" in msg else msg
-        elif msg.startswith("BUFFER_WARNING:"):
-            error_type = "BUFFER_WARNING"
-            error_message = msg.split(":", 1)[1] if ":" in msg else msg
-
-        # 缓冲区预警：只通知，不停止
-        if error_type == "BUFFER_WARNING":
-            self._overlay.update_text("网络延迟较高...")
-            # 不需要额外处理，继续录音
-            return
+        """流式识别错误回调
+
+        消息形如 "类型:详情"，按类型前缀分发到对应的处理方法。
+        """
+        prefix, sep, rest = msg.partition(":")
+        handler = self._streaming_error_handlers.get(prefix) if sep else None
+        if handler:
+            handler(rest)
+        else:
+            self._on_streaming_failure(msg)
 
-        # 缓冲区满：自动停止录音
-        if error_type == "BUFFER_FULL":
-            with self._state_lock:
-                current_state = self.state
+    def _on_buffer_warning(self, message: str):
+        """缓冲区预警：只提示，不停止录音"""
+        self._overlay.update_text("网络延迟较高...")
 
-            if current_state == AppState.RECORDING:
-                # 更新浮动窗口提示
-                self._overlay.update_text("网络延迟过高，正在停止...")
+    def _on_buffer_full(self, message: str):
+        """缓冲区满：自动停止录音并处理已录制内容"""
+        current_state = self.state
 
-                # 异步触发停止流程，处理已录制内容
-                def auto_stop_on_buffer_full():
-                    # 停止录音并处理已有音频
-                    self._stop_and_recognize()
+        if current_state != AppState.RECORDING:
+            self._on_streaming_failure(message)
+            return
 
-                    # 显示明确的通知
-                    self.platform_app.show_notification(
-                        title="语音输入",
-                        subtitle="",
-                        message="网络延迟过高，录音已自动停止，正在处理已录制内容",
-                        sound=False
-                    )
+        # 更新浮动窗口提示
+        self._overlay.update_text("网络延迟过高，正在停止...")
 
-                threading.Thread(target=auto_stop_on_buffer_full, daemon=True).start()
-                return
+        # 异步触发停止流程，处理已录制内容
+        def auto_stop_on_buffer_full():
+            # 停止录音并处理已有音频
+            self._stop_and_recognize()
+
+            # 显示明确的通知
+            self.platform_app.show_notification(
+                title="语音输入",
+                subtitle="",
+                message="网络延迟过高，录音已自动停止，正在处理已录制内容",
+                sound=False
+            )
+
+        self._worker.submit(auto_stop_on_buffer_full)
 
-        # 其他错误：原有逻辑
+    def _on_streaming_failure(self, error_message: str):
+        """其他流式识别错误：结束录音，尽量输出已有结果"""
         self._overlay.update_text("识别出错，正在结束...")
 
-        with self._state_lock:
-            current_state = self.state
+        current_state = self.state
         with self._streaming_lock:
             has_streaming = self._streaming_asr is not None
 
         if current_state == AppState.RECORDING and has_streaming:
             # 网络/服务端异常时，自动走停录流程，尽量输出已有 partial
-            threading.Thread(target=self._stop_and_recognize, daemon=True).start()
+            self._worker.submit(self._stop_and_recognize)
             return
 
         if current_state != AppState.PROCESSING:
@@ -315,9 +457,8 @@ class VoiceInputApp:
 
     def _on_auto_stop(self, reason: str):
         """处理自动停止事件"""
-        with self._state_lock:
-            if self.state != AppState.RECORDING:
-                return
+        if self.state != AppState.RECORDING:
+            return
 
         if reason == 'timeout':
             self._stop_and_recognize()
@@ -366,17 +507,18 @@ class VoiceInputApp:
         if streaming_asr:
             self._overlay.update_text("正在处理...")
 
+            context_future = self._prefetch_context_window()
+
             def finalize_streaming():
                 try:
                     final_text = streaming_asr.stop()
                     # 服务端未返回 final 时，回退到最近一次 partial，避免静音自动停止后丢半句
                     if not final_text or not final_text.strip():
-                        with self._streaming_text_lock:
-                            final_text = self._streaming_last_text
+                        final_text = self._streaming_last_text
                     self._overlay.hide()
 
                     if final_text and final_text.strip():
-                        self._correct_and_input(final_text)
+                        self._correct_and_input(final_text, context_future)
                     else:
                         self.platform_app.show_notification(
                             title="语音输入",
@@ -395,7 +537,7 @@ class VoiceInputApp:
                     )
                     self._set_state(AppState.IDLE)
 
-            threading.Thread(target=finalize_streaming, daemon=True).start()
+            self._worker.submit(finalize_streaming)
             return
 
         # 批处理模式
@@ -409,14 +551,30 @@ class VoiceInputApp:
             self._set_state(AppState.IDLE)
             return
 
-        threading.Thread(target=self._recognize_and_input, args=(audio_data,), daemon=True).start()
+        self._recognize_pool.submit(self._recognize_and_input, audio_data)
 
     def _recognize_and_input(self, audio_data):
         """识别并输入文字（批处理模式，在后台线程运行）"""
         try:
-            audio_base64 = audio_to_base64(audio_data)
+            # 按 PCM 内容哈希查缓存，同一段音频不重复请求 ASR
+            pcm = np.ascontiguousarray(audio_data, dtype=np.int16)
+            cache_key = (
+                self.config.asr_base_url,
+                self.config.asr_model,
+                hashlib.blake2b(memoryview(pcm).cast('B'), digest_size=16).digest(),
+            )
+            # ASR 请求期间并行读取上下文历史
+            context_future = self._prefetch_context_window()
+
+            cached_text = self._asr_cache.get(cache_key)
+            if cached_text is not None:
+                self._correct_and_input(cached_text, context_future)
+                return
+
+            # 直接编码成 data URL，省去再拼接一次前缀的整段字符串复制
+            audio_url = self._encode_audio(pcm)
 
-            if not audio_base64:
+            if not audio_url:
                 self.platform_app.show_notification(
                     title="语音输入",
                     subtitle="",
@@ -426,8 +584,10 @@ class VoiceInputApp:
                 self._set_state(AppState.IDLE)
                 return
 
-            original_text = self._recognize_speech(audio_base64)
-            self._correct_and_input(original_text)
+            original_text = self._recognize_speech(audio_url)
+            if original_text:
+                self._asr_cache.put(cache_key, original_text)
+            self._correct_and_input(original_text, context_future)
 
         except Exception as e:
             self.platform_app.show_notification(
@@ -438,43 +598,88 @@ class VoiceInputApp:
             )
             self._set_state(AppState.IDLE)
 
-    def _correct_and_input(self, original_text: str):
-        """纠错并输入文字（批处理和流式模式共用）"""
+    def _encode_audio(self, pcm) -> str:
+        """按配置把录音编码为上传用的 data URL（opus 不可用或编码失败时使用 wav）"""
+        if self.config.asr_audio_codec == "opus" and OPUS_AVAILABLE:
+            try:
+                return audio_to_opus_data_url(pcm)
+            except Exception:
+                pass
+        return audio_to_data_url(pcm)
+
+    def _prefetch_context_window(self) -> Optional[Future]:
+        """上下文纠错开启时，在后台开始读取上下文历史"""
+        if not self.config.context_correction_enabled:
+            return None
+        return _CONTEXT_PREFETCH_POOL.submit(self._get_context_window)
+
+    def _correct_and_input(self, original_text: str, context_future: Optional[Future] = None):
+        """纠错并输入文字（批处理和流式模式共用）
+
+        Args:
+            original_text: 识别结果
+            context_future: _prefetch_context_window 返回的预取任务，为 None 时现场读取
+        """
         try:
             corrected_text = original_text
             status = "none"
 
-            # 语音纠错
-            if original_text and original_text.strip() and len(original_text.strip()) >= 5 and self.config.llm_correction_enabled:
-                corrected_text = self._correct_with_llm(original_text)
-                if corrected_text != original_text:
-                    status = "auto"
-                else:
-                    status = "unchanged"
-
-            # 上下文纠错
-            if corrected_text and corrected_text.strip() and self.config.context_correction_enabled:
-                context_corrected = self._correct_with_context(corrected_text)
-                if context_corrected != corrected_text:
-                    corrected_text = context_corrected
-                    status = "auto"
+            stripped = original_text.strip() if original_text else ""
+            llm_enabled = len(stripped) >= 5 and self.config.llm_correction_enabled
+            skip_clean = self.config.skip_clean_correction_enabled
+            if llm_enabled and skip_clean and _is_likely_clean(stripped):
+                print(f"文字较短且只含常用汉字（{len(stripped)} 字），跳过语音纠错")
+                llm_enabled = False
+            context_enabled = bool(stripped) and self.config.context_correction_enabled
+            if context_enabled and skip_clean and len(stripped) <= CONTEXT_MIN_LEN:
+                print(f"文字较短（{len(stripped)} 字），跳过上下文纠错")
+                context_enabled = False
+            context_window = []
+            if context_enabled:
+                context_window = context_future.result() if context_future else self._get_context_window()
+
+            if llm_enabled and context_window and self.config.fused_correction_enabled:
+                # 两种纠错都需要时合并为一次请求（可在配置中关闭，改回两次串行请求）
+                corrected_text = self._correct_combined(original_text, context_window)
+                status = "auto" if corrected_text != original_text else "unchanged"
+            elif llm_enabled and context_window and self.config.parallel_correction_enabled:
+                # 两种纠错都基于识别结果并发请求：上下文纠错有改动时采用它，否则采用语音纠错结果
+                correction_future = _CONTEXT_CORRECTION_POOL.submit(
+                    self._correct_with_context, original_text, context_window)
+                llm_corrected = self._correct_with_llm(original_text)
+                context_corrected = correction_future.result()
+                corrected_text = context_corrected if context_corrected != original_text else llm_corrected
+                status = "auto" if corrected_text != original_text else "unchanged"
+            else:
+                # 语音纠错
+                if llm_enabled:
+                    corrected_text = self._correct_with_llm(original_text)
+                    if corrected_text != original_text:
+                        status = "auto"
+                    else:
+                        status = "unchanged"
+
+                # 上下文纠错（LLM 纠错结果已去除首尾空白，为空时原样返回识别结果）
+                if context_window:
+                    context_corrected = self._correct_with_context(corrected_text, context_window)
+                    if context_corrected != corrected_text:
+                        corrected_text = context_corrected
+                        status = "auto"
 
             # 添加到历史
+            # 纠错结果总是非空白文字，是否需要记录只取决于识别结果本身
             final_text = corrected_text
-            if final_text and final_text.strip():
-                history_mgr = get_history_manager()
-                history_mgr.add(
+            if stripped:
+                self.history_mgr.add(
                     original=original_text,
                     corrected=corrected_text if status != "none" else None,
                     text=final_text,
                     status=status
                 )
-                self._update_stats_display()
+                self._request_stats_update()
 
             if final_text:
-                from platform_support import get_text_inputter
-                input_text = get_text_inputter()
-                input_text(final_text)
+                self._input_text(final_text)
             else:
                 self.platform_app.show_notification(
                     title="语音输入",
@@ -493,16 +698,27 @@ class VoiceInputApp:
         finally:
             self._set_state(AppState.IDLE)
 
-    def _recognize_speech(self, audio_base64: str) -> str:
-        """调用 ASR 模型进行语音识别"""
+    def _get_client(self, api_key: str, base_url: str) -> "OpenAI":
+        """获取（或创建）指定 api_key 和 base_url 的 OpenAI 客户端"""
+        key = (api_key, base_url)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                # openai 依赖较多，首次使用时再导入，加快启动
+                from openai import OpenAI
+                client = self._clients[key] = OpenAI(api_key=api_key, base_url=base_url)
+            return client
+
+    def _recognize_speech(self, audio_url: str) -> str:
+        """调用 ASR 模型进行语音识别（audio_url 为 WAV 的 base64 data URL）
+
+        以流式方式读取结果，边接收边拼接。
+        """
         api_key = self.config.get_effective_api_key()
         if not api_key:
             raise ValueError("请在设置中配置 API Key 或设置环境变量 DASHSCOPE_API_KEY")
 
-        client = OpenAI(
-            api_key=api_key,
-            base_url=self.config.asr_base_url
-        )
+        client = self._get_client(api_key, self.config.asr_base_url)
 
         completion = client.chat.completions.create(
             model=self.config.asr_model,
@@ -511,110 +727,194 @@ class VoiceInputApp:
                 "content": [{
                     "type": "input_audio",
                     "input_audio": {
-                        "data": f"data:audio/wav;base64,{audio_base64}"
+                        "data": audio_url
                     }
                 }]
             }],
-            stream=False,
-            extra_body={"asr_options": {"enable_itn": False}}
+            stream=True,
+            extra_body=_ASR_EXTRA_BODY
         )
 
-        return completion.choices[0].message.content
+        parts = []
+        for chunk in completion:
+            # 末尾的用量统计块没有 choices
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
 
-    def _correct_with_llm(self, text: str) -> str:
-        """使用 LLM 对语音识别结果进行纠错"""
+        return "".join(parts)
+
+    def _chat_llm(self, messages: list, fallback: str) -> str:
+        """调用 LLM 并返回去除首尾空白的回复，结果按消息内容缓存
+
+        未配置 API Key、请求失败或回复为空时返回 fallback。
+        """
         api_key = self.config.get_effective_llm_api_key()
         if not api_key:
-            return text
+            return fallback
 
-        provider = self.config.llm_provider
-        if provider == "deepseek":
-            base_url = "https://api.deepseek.com"
-        else:
-            base_url = "https://api.deepseek.com"
+        base_url = self._llm_base_url
+        model = self.config.llm_model
+        parts = []
+        for msg in messages:
+            parts.append(msg["role"])
+            parts.append(msg["content"])
+        cache_key = (base_url, model, _text_digest(*parts))
+        cached = self._llm_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        client = OpenAI(
-            api_key=api_key,
-            base_url=base_url
-        )
+        client = self._get_client(api_key, base_url)
 
-        prompt = self.config.llm_correction_prompt
         try:
             completion = client.chat.completions.create(
-                model=self.config.llm_model,
-                messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": text}
-                ],
+                model=model,
+                messages=messages,
                 stream=False
             )
-            corrected_text = completion.choices[0].message.content
-            return corrected_text.strip() if corrected_text else text
+            reply = (completion.choices[0].message.content or "").strip()
+            if not reply:
+                return fallback
+            self._llm_cache.put(cache_key, reply)
+            return reply
         except Exception:
-            return text
+            return fallback
 
-    def _correct_with_context(self, text: str) -> str:
-        """使用上下文对语音识别结果进行纠错"""
-        history_mgr = get_history_manager()
-        recent = history_mgr.get_recent(
+    def _get_context_window(self) -> list:
+        """获取上下文纠错使用的历史消息文字"""
+        recent = self.history_mgr.get_recent(
             self.config.context_window_size,
             ttl_minutes=self.config.context_history_ttl
         )
-        context_window = [h["text"] for h in recent]
-        if not context_window:
-            return text
+        return [h["text"] for h in recent]
 
-        api_key = self.config.get_effective_llm_api_key()
-        if not api_key:
-            return text
+    def _format_context_prompt(self, text: str, context_window: list) -> str:
+        """用历史消息和当前文字填充上下文纠错提示词
 
-        provider = self.config.llm_provider
-        if provider == "deepseek":
-            base_url = "https://api.deepseek.com"
+        历史部分先填入模板并缓存，上下文未变化时只需再填入当前文字。
+        """
+        prompt_template = self.config.context_correction_prompt
+        key = (prompt_template, tuple(context_window))
+        cached = self._context_prompt_cache
+        if cached is not None and cached[0] == key:
+            partial = cached[1]
         else:
-            base_url = "https://api.deepseek.com"
+            history_text = "\n".join([f"{i+1}. {msg}" for i, msg in enumerate(context_window)])
+            # 当前文字先用占位符代替，结果与一次性 format 完全一致
+            partial = prompt_template.format(history=history_text, current=_CURRENT_PLACEHOLDER)
+            self._context_prompt_cache = (key, partial)
+        return partial.replace(_CURRENT_PLACEHOLDER, text)
 
-        client = OpenAI(
-            api_key=api_key,
-            base_url=base_url
-        )
-
-        history_text = "\n".join([f"{i+1}. {msg}" for i, msg in enumerate(context_window)])
-        prompt_template = self.config.context_correction_prompt
-        prompt = prompt_template.format(history=history_text, current=text)
+    def _correct_with_llm(self, text: str) -> str:
+        """使用 LLM 对语音识别结果进行纠错"""
+        return self._chat_llm([
+            {"role": "system", "content": self.config.llm_correction_prompt},
+            {"role": "user", "content": text}
+        ], text)
 
-        try:
-            completion = client.chat.completions.create(
-                model=self.config.llm_model,
-                messages=[{"role": "user", "content": prompt}],
-                stream=False
-            )
-            corrected_text = completion.choices[0].message.content
-            return corrected_text.strip() if corrected_text else text
-        except Exception:
+    def _correct_with_context(self, text: str, context_window: list = None) -> str:
+        """使用上下文对语音识别结果进行纠错"""
+        if context_window is None:
+            context_window = self._get_context_window()
+        if not context_window:
             return text
 
+        prompt = self._format_context_prompt(text, context_window)
+        return self._chat_llm([{"role": "user", "content": prompt}], text)
+
+    def _correct_combined(self, text: str, context_window: list) -> str:
+        """一次请求同时完成语音纠错和上下文纠错
+
+        纠错提示词作为 system 消息，填充好的上下文纠错提示词作为 user 消息，
+        省去两次串行请求中的一次网络往返。
+        """
+        return self._chat_llm([
+            {"role": "system", "content": self.config.llm_correction_prompt},
+            {"role": "user", "content": self._format_context_prompt(text, context_window)}
+        ], text)
+
     def _start_settings_server(self):
-        """在后台启动设置服务"""
+        """在后台启动设置服务（只启动一次）"""
+        with self._settings_server_lock:
+            if self._settings_server_started:
+                return
+            self._settings_server_started = True
+
         def run_server():
             import uvicorn
             from settings_server import app
-            uvicorn.run(app, host="127.0.0.1", port=SETTINGS_PORT, log_level="warning")
+            # loop/http 保持 auto：安装了 uvloop、httptools 时 uvicorn 会自动选用
+            uvicorn.run(app, host="127.0.0.1", port=SETTINGS_PORT, log_level="warning",
+                        access_log=False)
 
         thread = threading.Thread(target=run_server, daemon=True)
         thread.start()
 
+    @staticmethod
+    def _wait_for_settings_server(timeout: float) -> bool:
+        """等待设置服务端口可连接"""
+        import socket
+        import time
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(("127.0.0.1", SETTINGS_PORT), timeout=0.2):
+                    return True
+            except OSError:
+                time.sleep(0.05)
+        return False
+
+    def _check_config_changed(self):
+        """配置文件修改时间变化时重新加载配置"""
+        try:
+            mtime = os.path.getmtime(self.config.config_file)
+        except OSError:
+            return
+        if mtime > self._config_mtime:
+            if self._config_mtime > 0:
+                self._reload_config()
+            self._config_mtime = mtime
+
     def _start_config_watcher(self):
-        """启动配置文件监控"""
+        """启动配置文件监控
+
+        安装了 watchdog 时使用系统文件事件通知（macOS 为 FSEvents），无需轮询；
+        否则回退到每秒检查一次修改时间。
+        """
+        self._check_config_changed()
+
+        if WATCHDOG_AVAILABLE:
+            config_path = os.path.abspath(str(self.config.config_file))
+            app = self
+
+            class ConfigFileHandler(FileSystemEventHandler):
+                def on_any_event(self, event):
+                    # 配置使用原子替换写入，会表现为 moved/created 事件
+                    paths = (getattr(event, "src_path", None), getattr(event, "dest_path", None))
+                    if config_path in paths:
+                        try:
+                            app._check_config_changed()
+                        except Exception:
+                            pass
+
+            try:
+                observer = Observer()
+                observer.daemon = True
+                observer.schedule(ConfigFileHandler(), os.path.dirname(config_path), recursive=False)
+                observer.start()
+                self._config_observer = observer
+                return
+            except Exception:
+                # 文件事件不可用时回退到轮询
+                pass
+
         def watch_config():
             import time
             while self._running:
                 try:
-                    mtime = os.path.getmtime(self.config.config_file)
-                    if mtime > self._config_mtime:
-                        if self._config_mtime > 0:
-                            self._reload_config()
-                        self._config_mtime = mtime
+                    self._check_config_changed()
                 except Exception:
                     pass
                 time.sleep(1)
@@ -622,23 +922,39 @@ class VoiceInputApp:
         thread = threading.Thread(target=watch_config, daemon=True)
         thread.start()
 
+    def _stop_config_watcher(self):
+        """停止配置文件事件监听（可重复调用）"""
+        observer = self._config_observer
+        self._config_observer = None
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=1)
+
     def _reload_config(self):
         """重新加载配置"""
         self.config = get_config()
-        self.config._config = self.config._load_config()
+        self.config.reload()
+        self._llm_base_url = self.config.llm_base_url
+        self._llm_cache.clear()
+        # 密钥或接口地址可能已变化，丢弃旧客户端
+        with self._clients_lock:
+            self._clients.clear()
         self.recorder.set_device(self.config.microphone_device_id)
         # 更新快捷键监听
         self.keyboard_listener.set_shortcut(self.config.shortcut_key)
 
     def _open_settings(self, _):
-        """打开设置页面"""
-        webbrowser.open(f"http://127.0.0.1:{SETTINGS_PORT}/settings")
+        """打开设置页面（首次打开时才启动设置服务）"""
+        def open_page():
+            import webbrowser
+            self._start_settings_server()
+            self._wait_for_settings_server(SETTINGS_STARTUP_TIMEOUT)
+            webbrowser.open(f"http://127.0.0.1:{SETTINGS_PORT}/settings")
+
+        threading.Thread(target=open_page, daemon=True).start()
 
     def run(self):
         """启动应用"""
-        # 启动设置服务
-        self._start_settings_server()
-
         # 启动配置监控
         self._start_config_watcher()
 
@@ -648,8 +964,9 @@ class VoiceInputApp:
             on_open_settings=self._open_settings
         )
 
-        # 初始化统计显示
+        # 初始化统计显示，并启动统计刷新线程
         self._update_stats_display()
+        threading.Thread(target=self._stats_update_loop, daemon=True).start()
 
         # 启动键盘监听
         self.keyboard_listener.start()
@@ -659,6 +976,10 @@ class VoiceInputApp:
         finally:
             self._running = False
             self.keyboard_listener.stop()
+            self._stop_config_watcher()
+            self._recognize_pool.shutdown(wait=False)
+            self._worker.shutdown(wait=False, cancel_futures=True)
+            self.history_mgr.close()
 
 
 def main():
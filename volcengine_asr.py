@@ -5,16 +5,34 @@
 协议参考：火山引擎语音识别 BigModel API
 """
 import asyncio
-import gzip
 import json
 import struct
 import threading
 import time
 import uuid
-from typing import Callable, Optional
+import zlib
+from typing import Callable, Optional, Union
 
 import websockets
 
+try:
+    import orjson
+
+    _load_json = orjson.loads
+    _dump_json = orjson.dumps
+except ImportError:
+    _load_json = json.loads
+
+    def _dump_json(obj) -> bytes:
+        """序列化为 UTF-8 编码的 JSON"""
+        return json.dumps(obj).encode("utf-8")
+
+try:
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
 
 # 协议常量
 PROTOCOL_VERSION = 0b0001
@@ -40,9 +58,52 @@ MSG_JSON = 0b0001
 MSG_NO_COMPRESSION = 0b0000
 MSG_GZIP = 0b0001
 
+# 音频帧压缩方式：协议要求音频同样经 GZIP 压缩（见 火山引擎ASR调用说明.md），
+# PCM 压缩收益很小，使用最快的压缩级别（GZIP_LEVEL）
+AUDIO_COMPRESSION = MSG_GZIP
+
+# gzip 压缩级别：载荷很小，用最快的级别即可
+GZIP_LEVEL = 1
+# zlib 的 wbits 参数：31 表示 gzip 格式（带 gzip 头和尾）
+_GZIP_WBITS = 31
+
 # WebSocket 地址
 WS_URL = "wss://openspeech.bytedance.com/api/v3/sauc/bigmodel"
 
+# 初始化请求内容（每次会话都相同）
+INIT_PAYLOAD = {
+    "user": {
+        "uid": "voice_input_user"
+    },
+    "audio": {
+        "format": "pcm",
+        "codec": "pcm",
+        "rate": 16000,
+        "bits": 16,
+        "channel": 1
+    },
+    "request": {
+        "model_name": "bigmodel",
+        "enable_punc": True,
+        "enable_itn": True,
+        "result_type": "single"
+    }
+}
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    """压缩为完整的 gzip 数据（直接调用 zlib，不经过 GzipFile 包装）
+
+    协议要求每个消息都是独立的 gzip 数据，因此每次新建压缩对象，不能跨消息复用。
+    """
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_decompress(data: Union[bytes, memoryview]) -> bytes:
+    """解压 gzip 数据（直接调用 zlib）"""
+    return zlib.decompress(data, _GZIP_WBITS)
+
 
 def _build_header(message_type: int, flags: int, serialization: int, compression: int) -> bytes:
     """构建 4 字节协议头"""
@@ -54,69 +115,111 @@ def _build_header(message_type: int, flags: int, serialization: int, compression
     return bytes(header)
 
 
-def _build_request(payload: dict, seq: int) -> bytes:
-    """构建完整请求（header + seq + payload size + payload）"""
-    payload_bytes = json.dumps(payload).encode("utf-8")
-    compressed = gzip.compress(payload_bytes)
-    header = _build_header(CLIENT_FULL_REQUEST, MSG_POS_SEQUENCE, MSG_JSON, MSG_GZIP)
-    return header + struct.pack(">i", seq) + struct.pack(">I", len(compressed)) + compressed
+# 客户端发送的协议头都是固定值，模块加载时生成一次
+_HEADER_FULL_REQUEST = _build_header(CLIENT_FULL_REQUEST, MSG_POS_SEQUENCE, MSG_JSON, MSG_GZIP)
+_HEADER_AUDIO = _build_header(CLIENT_AUDIO_ONLY, MSG_POS_SEQUENCE, MSG_JSON, AUDIO_COMPRESSION)
+_HEADER_AUDIO_LAST = _build_header(CLIENT_AUDIO_ONLY, MSG_NEG_WITH_SEQUENCE, MSG_JSON, AUDIO_COMPRESSION)
 
+# 帧前缀：4 字节协议头 + seq + payload size，一次打包
+_FRAME_PREFIX_STRUCT = struct.Struct(">4siI")
+# 错误响应的 payload 前缀：错误码 + payload size
+_ERROR_PREFIX_STRUCT = struct.Struct(">iI")
+# 4 字节协议头，一次读出
+_HEADER_PARSE_STRUCT = struct.Struct(">4B")
 
-def _build_audio_frame(audio_bytes: bytes, seq: int, is_last: bool = False) -> bytes:
-    """构建音频帧（header + seq + payload size + compressed audio）"""
+# 绝大多数响应是带序号、gzip 压缩的 JSON 识别结果，其协议头字节固定，解析时走快速路径
+_RESULT_B0 = (PROTOCOL_VERSION << 4) | HEADER_SIZE
+_RESULT_B1_PARTIAL = (SERVER_FULL_RESPONSE << 4) | MSG_POS_SEQUENCE
+_RESULT_B1_FINAL = (SERVER_FULL_RESPONSE << 4) | MSG_NEG_WITH_SEQUENCE
+_RESULT_B2 = (MSG_JSON << 4) | MSG_GZIP
+# 快速路径下 payload size 的位置：4 字节协议头 + 4 字节 seq 之后
+_RESULT_SIZE_OFFSET = 8
+
+
+def _build_request(compressed: bytes, seq: int) -> bytes:
+    """构建完整请求（header + seq + payload size + gzip 压缩后的 payload）"""
+    return _FRAME_PREFIX_STRUCT.pack(_HEADER_FULL_REQUEST, seq, len(compressed)) + compressed
+
+
+def _build_audio_frame(audio_bytes: Union[bytes, memoryview], seq: int, is_last: bool = False) -> bytes:
+    """构建音频帧（header + seq + payload size + audio），audio_bytes 可以是缓冲区视图，拼接时只复制一次"""
     if is_last:
-        flags = MSG_NEG_WITH_SEQUENCE
+        header = _HEADER_AUDIO_LAST
         seq = -seq
     else:
-        flags = MSG_POS_SEQUENCE
-    header = _build_header(CLIENT_AUDIO_ONLY, flags, MSG_JSON, MSG_GZIP)
-    compressed = gzip.compress(audio_bytes)
-    return header + struct.pack(">i", seq) + struct.pack(">I", len(compressed)) + compressed
+        header = _HEADER_AUDIO
+    if AUDIO_COMPRESSION == MSG_GZIP:
+        audio_bytes = _gzip_compress(audio_bytes)
+    return _FRAME_PREFIX_STRUCT.pack(header, seq, len(audio_bytes)) + audio_bytes
+
+
+# 初始化请求内容固定，只需压缩一次
+_INIT_PAYLOAD_GZIP = _gzip_compress(_dump_json(INIT_PAYLOAD))
+
+
+def _result_text(msg: dict) -> str:
+    """从识别结果 JSON 中取出文字"""
+    # 2.0 格式: {"result": {"text": "..."}}
+    result = msg.get("result", {})
+    if isinstance(result, dict):
+        return result.get("text", "")
+    # 兼容旧格式: {"result": [{"text": "..."}]}
+    return "".join([item.get("text", "") for item in result])
 
 
 def _parse_response(data: bytes) -> dict:
-    """解析服务端响应"""
+    """解析服务端响应
+
+    按偏移量读取各字段，payload 通过 memoryview 引用，不为中间切片复制数据。
+    常见的识别结果响应直接按固定布局解析，其他响应走通用解析。
+    """
+    if (len(data) > _RESULT_SIZE_OFFSET + 4 and data[0] == _RESULT_B0 and data[2] == _RESULT_B2
+            and (data[1] == _RESULT_B1_PARTIAL or data[1] == _RESULT_B1_FINAL)):
+        view = memoryview(data)
+        start = _RESULT_SIZE_OFFSET + 4
+        payload_size = int.from_bytes(view[_RESULT_SIZE_OFFSET:start], "big")
+        msg = _load_json(_gzip_decompress(view[start:start + payload_size]))
+        return {
+            "type": "result",
+            "text": _result_text(msg),
+            "is_final": data[1] == _RESULT_B1_FINAL
+        }
+
     if len(data) < 4:
         return {"type": "error", "text": "响应数据太短"}
 
-    header = data[0:4]
-    msg_type = (header[1] >> 4) & 0x0F
-    flags = header[1] & 0x0F
-    serialization = (header[2] >> 4) & 0x0F
-    compression = header[2] & 0x0F
+    view = memoryview(data)
+    b0, b1, b2, _ = _HEADER_PARSE_STRUCT.unpack_from(data)
+    msg_type = b1 >> 4
+    flags = b1 & 0x0F
+    serialization = b2 >> 4
+    compression = b2 & 0x0F
 
     # header_size 字段决定 payload 起始位置
-    header_word_size = data[0] & 0x0F  # 以 4 字节为单位
-    payload = data[header_word_size * 4:]
+    header_word_size = b0 & 0x0F  # 以 4 字节为单位
+    offset = header_word_size * 4
 
     is_final = False
     # 解析 flags 中的 seq 和 last 标记
     if flags & 0x01:  # 有 sequence
-        payload = payload[4:]  # 跳过 seq (4 bytes)
+        offset += 4  # 跳过 seq (4 bytes)
     if flags & 0x02:  # negative / last
         is_final = True
 
     if msg_type == SERVER_FULL_RESPONSE:
-        payload_size = struct.unpack(">I", payload[:4])[0]
-        payload_bytes = payload[4:4 + payload_size]
+        payload_size = int.from_bytes(view[offset:offset + 4], "big")
+        offset += 4
+        payload_bytes = view[offset:offset + payload_size]
 
         if compression == MSG_GZIP:
-            payload_bytes = gzip.decompress(payload_bytes)
+            payload_bytes = _gzip_decompress(payload_bytes)
+        else:
+            payload_bytes = bytes(payload_bytes)  # 标准库 json.loads 不接受 memoryview
 
         if serialization == MSG_JSON:
-            msg = json.loads(payload_bytes)
-            # 2.0 格式: {"result": {"text": "..."}}
-            result = msg.get("result", {})
-            if isinstance(result, dict):
-                text = result.get("text", "")
-            else:
-                # 兼容旧格式: {"result": [{"text": "..."}]}
-                text_parts = [item.get("text", "") for item in result]
-                text = "".join(text_parts)
-
             return {
                 "type": "result",
-                "text": text,
+                "text": _result_text(_load_json(payload_bytes)),
                 "is_final": is_final
             }
 
@@ -124,12 +227,14 @@ def _parse_response(data: bytes) -> dict:
         return {"type": "ack"}
 
     elif msg_type == SERVER_ERROR:
-        code = struct.unpack(">i", payload[:4])[0]
-        err_payload_size = struct.unpack(">I", payload[4:8])[0]
-        payload_bytes = payload[8:8 + err_payload_size]
+        code, err_payload_size = _ERROR_PREFIX_STRUCT.unpack_from(data, offset)
+        offset += _ERROR_PREFIX_STRUCT.size
+        payload_bytes = view[offset:offset + err_payload_size]
         if compression == MSG_GZIP:
-            payload_bytes = gzip.decompress(payload_bytes)
-        error_info = json.loads(payload_bytes) if serialization == MSG_JSON else {}
+            payload_bytes = _gzip_decompress(payload_bytes)
+        else:
+            payload_bytes = bytes(payload_bytes)
+        error_info = _load_json(payload_bytes) if serialization == MSG_JSON else {}
         return {"type": "error", "text": str(error_info)}
 
     return {"type": "unknown"}
@@ -149,6 +254,12 @@ class VolcengineStreamingASR:
     STOP_WAIT_TIMEOUT_SECONDS = 12
     # 超时后主动关闭 WebSocket 的补充等待时长
     FORCE_CLOSE_WAIT_SECONDS = 2
+    # 发送协程空闲等待的上限（有新音频或停止时会被立即唤醒，这里只是兜底）
+    SEND_IDLE_TIMEOUT_SECONDS = 0.5
+    # 超过该大小的响应在线程池中解析（解压和 JSON 解析不阻塞事件循环，音频发送不受影响）
+    OFFLOAD_PARSE_BYTES = 16 * 1024
+    # 积压时每轮最多连续发送的音频帧数（先一起组帧，再连续发送）
+    SEND_BATCH_MAX_FRAMES = 10
 
     def __init__(
         self,
@@ -170,8 +281,17 @@ class VolcengineStreamingASR:
         self._ws = None
         self._connected = asyncio.Event()
         self._stopped = False
-        self._audio_buffer = bytearray()
-        self._buffer_lock = threading.Lock()
+        # 预分配的环形缓冲区：feed_audio 写入，发送协程直接从视图组帧，不再另行切块复制
+        self._ring = bytearray(self.MAX_BUFFER_SIZE)
+        self._ring_view = memoryview(self._ring)
+        # 累计写入/发送的字节数，分别只由写入方和发送协程修改（单生产者单消费者）
+        self._write_pos = 0
+        self._read_pos = 0
+        self._buffer_lock = threading.Lock()  # 只在写入方之间互斥，发送协程不加锁
+        # 有新音频块或停止时唤醒发送协程（在事件循环中创建）
+        self._send_wake: Optional[asyncio.Event] = None
+        # WebSocket 连接关闭后置位（在事件循环中创建，由 _watch_closed 设置）
+        self._ws_closed: Optional[asyncio.Event] = None
         self._final_text = ""
         self._done_event = threading.Event()
         self._seq = 1  # 协议序号
@@ -189,17 +309,19 @@ class VolcengineStreamingASR:
         self._seq = 1
         self._request_id = str(uuid.uuid4())
         self._overflow_notified = False
+        self._send_wake = None
         # 重置缓冲区监控状态
         with self._buffer_lock:
-            self._audio_buffer.clear()
+            self._write_pos = 0
+            self._read_pos = 0
             self._buffer_warning_sent = False
             self._buffer_full_triggered = False
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
 
     def _run_loop(self):
-        """运行 asyncio 事件循环"""
-        self._loop = asyncio.new_event_loop()
+        """运行 asyncio 事件循环（安装了 uvloop 时使用 uvloop，只影响本会话线程）"""
+        self._loop = _new_event_loop()
         asyncio.set_event_loop(self._loop)
         try:
             self._loop.run_until_complete(self._session())
@@ -212,6 +334,7 @@ class VolcengineStreamingASR:
 
     async def _session(self):
         """WebSocket 会话"""
+        self._send_wake = asyncio.Event()
         headers = {
             "X-Api-App-Key": self.app_key,
             "X-Api-Access-Key": self.access_key,
@@ -219,7 +342,8 @@ class VolcengineStreamingASR:
             "X-Api-Request-Id": self._request_id,
         }
 
-        connect_kwargs = {"additional_headers": headers}
+        # 请求和音频帧在协议层已做 gzip 压缩，关闭 permessage-deflate，避免每帧再经过一次 zlib
+        connect_kwargs = {"additional_headers": headers, "compression": None}
         # websockets>=15 默认读取系统代理；这里优先禁用代理，避免缺少 python-socks 时直接失败
         try:
             connect_ctx = websockets.connect(WS_URL, proxy=None, **connect_kwargs)
@@ -230,47 +354,33 @@ class VolcengineStreamingASR:
             async with connect_ctx as ws:
                 self._ws = ws
                 self._connected.set()
+                self._ws_closed = asyncio.Event()
+                closed_watcher = asyncio.create_task(self._watch_closed(ws, self._ws_closed))
+                try:
+                    # 发送初始化请求
+                    await ws.send(_build_request(_INIT_PAYLOAD_GZIP, self._seq))
+                    self._seq += 1
 
-                # 发送初始化请求
-                init_payload = {
-                    "user": {
-                        "uid": "voice_input_user"
-                    },
-                    "audio": {
-                        "format": "pcm",
-                        "codec": "pcm",
-                        "rate": 16000,
-                        "bits": 16,
-                        "channel": 1
-                    },
-                    "request": {
-                        "model_name": "bigmodel",
-                        "enable_punc": True,
-                        "enable_itn": True,
-                        "result_type": "single"
-                    }
-                }
-
-                await ws.send(_build_request(init_payload, self._seq))
-                self._seq += 1
-
-                # 等待初始化响应
-                init_resp = await ws.recv()
-                if isinstance(init_resp, str):
-                    init_resp = init_resp.encode("utf-8")
-                init_result = _parse_response(init_resp)
-                if init_result["type"] == "error":
-                    if self.on_error:
-                        self.on_error(init_result.get("text", "初始化失败"))
-                    self._stopped = True
-                    return
+                    # 等待初始化响应
+                    init_resp = await ws.recv()
+                    if isinstance(init_resp, str):
+                        init_resp = init_resp.encode("utf-8")
+                    init_result = _parse_response(init_resp)
+                    if init_result["type"] == "error":
+                        if self.on_error:
+                            self.on_error(init_result.get("text", "初始化失败"))
+                        self._stopped = True
+                        return
 
-                # 启动音频发送协程和接收协程
-                send_task = asyncio.create_task(self._send_audio_loop())
-                recv_task = asyncio.create_task(self._recv_loop())
+                    # 启动音频发送协程和接收协程
+                    send_task = asyncio.create_task(self._send_audio_loop())
+                    recv_task = asyncio.create_task(self._recv_loop())
 
-                # 等待两个任务完成
-                await asyncio.gather(send_task, recv_task)
+                    # 等待两个任务完成
+                    await asyncio.gather(send_task, recv_task)
+                finally:
+                    closed_watcher.cancel()
+                    await asyncio.gather(closed_watcher, return_exceptions=True)
 
         except websockets.exceptions.ConnectionClosed as e:
             if not self._stopped:
@@ -283,53 +393,76 @@ class VolcengineStreamingASR:
             self._ws = None
 
     async def _send_audio_loop(self):
-        """音频发送循环：从缓冲区取数据，按 200ms 分块发送"""
+        """音频发送循环：取出已切好的 200ms 音频块发送，没有数据时等待唤醒"""
+        # 循环内反复用到的属性和方法先绑定为局部变量
+        ws = self._ws
+        if ws is None:
+            return
+        send = ws.send
+        wake = self._send_wake
+        take_frame = self._take_audio_frame
+        ws_closed = self._ws_closed
+        chunk_size = self.CHUNK_SIZE
+        idle_timeout = self.SEND_IDLE_TIMEOUT_SECONDS
+        batch_max = self.SEND_BATCH_MAX_FRAMES
+
         while not self._stopped:
-            if self._ws and self._is_ws_closed():
+            if ws_closed.is_set():
                 self._stopped = True
                 break
 
-            chunk = None
-            with self._buffer_lock:
-                if len(self._audio_buffer) >= self.CHUNK_SIZE:
-                    chunk = bytes(self._audio_buffer[:self.CHUNK_SIZE])
-                    del self._audio_buffer[:self.CHUNK_SIZE]
+            if self._write_pos - self._read_pos < chunk_size:
+                # 先清除再复查，避免错过清除前刚写入的音频
+                wake.clear()
+                if self._write_pos - self._read_pos < chunk_size and not self._stopped:
+                    try:
+                        await asyncio.wait_for(wake.wait(), timeout=idle_timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                continue
 
-            if chunk and self._ws:
-                try:
-                    await self._ws.send(_build_audio_frame(chunk, self._seq, is_last=False))
-                    self._seq += 1
-                except Exception as e:
-                    if not self._stopped:
-                        self._emit_error(f"发送音频失败: {e}")
-                    self._stopped = True
-                    break
-            else:
-                await asyncio.sleep(0.05)
+            # 网络抖动后可能积压多块：先全部组帧（尽早释放环形缓冲区空间），再连续发送
+            n_ready = (self._write_pos - self._read_pos) // chunk_size
+            frames = [take_frame() for _ in range(min(n_ready, batch_max))]
+            try:
+                for frame in frames:
+                    await send(frame)
+            except Exception as e:
+                if not self._stopped:
+                    self._emit_error(f"发送音频失败: {e}")
+                self._stopped = True
+                break
 
-        # 发送剩余缓冲区数据
-        while self._ws:
-            if self._is_ws_closed():
+        # 发送剩余缓冲区数据（包括不足一块的尾部）
+        while self._write_pos > self._read_pos:
+            if ws_closed.is_set():
                 break
-            chunk = None
-            with self._buffer_lock:
-                if len(self._audio_buffer) == 0:
-                    break
-                chunk = bytes(self._audio_buffer[:self.CHUNK_SIZE])
-                del self._audio_buffer[:self.CHUNK_SIZE]
             try:
-                await self._ws.send(_build_audio_frame(chunk, self._seq, is_last=False))
-                self._seq += 1
+                await send(take_frame())
             except Exception:
                 break
 
         # 发送结束标记
-        if self._ws and not self._is_ws_closed():
+        if not ws_closed.is_set():
             try:
-                await self._ws.send(_build_audio_frame(b"", self._seq, is_last=True))
+                await send(_build_audio_frame(b"", self._seq, is_last=True))
             except Exception:
                 pass
 
+    def _take_audio_frame(self) -> bytes:
+        """从环形缓冲区取出最多一块音频并组成音频帧（同时分配协议序号）
+
+        组帧时已把数据复制进帧内，随后才推进读位置，写入方不会覆盖尚未复制的数据。
+        gzip 在会话线程上执行：一块 200ms 音频以压缩级别 1 压缩约需 0.1ms，
+        会话线程独立于录音线程，无需再把组帧挪到写入方。
+        """
+        start = self._read_pos % self.MAX_BUFFER_SIZE
+        size = min(self.CHUNK_SIZE, self._write_pos - self._read_pos, self.MAX_BUFFER_SIZE - start)
+        frame = _build_audio_frame(self._ring_view[start:start + size], self._seq, is_last=False)
+        self._read_pos += size
+        self._seq += 1
+        return frame
+
     async def _recv_loop(self):
         """接收服务端响应"""
         stopped_since = None
@@ -339,7 +472,10 @@ class VolcengineStreamingASR:
                 if isinstance(data, str):
                     data = data.encode("utf-8")
 
-                result = _parse_response(data)
+                if len(data) > self.OFFLOAD_PARSE_BYTES:
+                    result = await asyncio.get_running_loop().run_in_executor(None, _parse_response, data)
+                else:
+                    result = _parse_response(data)
                 stopped_since = None
 
                 if result["type"] == "result":
@@ -380,19 +516,33 @@ class VolcengineStreamingASR:
                 return
 
     def feed_audio(self, pcm_bytes: bytes):
-        """喂入 PCM 音频数据（线程安全）"""
+        """喂入 PCM 音频数据（线程安全，接受 bytes 或 memoryview，数据会被复制进内部环形缓冲区）"""
         if self._stopped or not pcm_bytes:
             return
 
         buffer_warning = False
         buffer_full = False
 
+        capacity = self.MAX_BUFFER_SIZE
         with self._buffer_lock:
-            self._audio_buffer.extend(pcm_bytes)
-            current_size = len(self._audio_buffer)
+            write_pos = self._write_pos
+            buffered = write_pos - self._read_pos
+            # 缓冲区放不下的部分丢弃（此时会通知主程序停止录音）
+            size = min(len(pcm_bytes), capacity - buffered)
+            if size > 0:
+                start = write_pos % capacity
+                first = min(size, capacity - start)
+                self._ring_view[start:start + first] = pcm_bytes[:first]
+                if size > first:
+                    self._ring_view[:size - first] = pcm_bytes[first:size]
+                # 先写数据再推进写位置，发送协程看到新位置时数据已就绪
+                self._write_pos = write_pos + size
+            current_size = buffered + len(pcm_bytes)
+            # 跨过块边界时才需要唤醒发送协程
+            chunk_ready = (self._write_pos // self.CHUNK_SIZE) > (write_pos // self.CHUNK_SIZE)
 
             # 检查缓冲区满（100%）
-            if current_size > self.MAX_BUFFER_SIZE:
+            if current_size > capacity:
                 if not self._buffer_full_triggered:
                     self._buffer_full_triggered = True
                     buffer_full = True
@@ -402,6 +552,9 @@ class VolcengineStreamingASR:
                     self._buffer_warning_sent = True
                     buffer_warning = True
 
+        if chunk_ready:
+            self._wake_sender()
+
         # 在锁外触发回调，避免死锁
         if buffer_full:
             # 缓冲区满：触发错误回调，让主程序停止录音
@@ -419,6 +572,7 @@ class VolcengineStreamingASR:
         with self._stop_lock:
             self._stopped = True
             thread = self._thread
+        self._wake_sender()
 
         if not thread:
             return self._final_text
@@ -443,6 +597,18 @@ class VolcengineStreamingASR:
         """获取最终识别文本"""
         return self._final_text
 
+    def _wake_sender(self):
+        """从其他线程唤醒发送协程"""
+        loop = self._loop
+        wake = self._send_wake
+        if loop is None or wake is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wake.set)
+        except RuntimeError:
+            # 事件循环已关闭
+            pass
+
     def _emit_error(self, msg: str):
         """安全触发错误回调"""
         if self.on_error:
@@ -451,21 +617,10 @@ class VolcengineStreamingASR:
             except Exception:
                 pass
 
-    def _is_ws_closed(self) -> bool:
-        """兼容不同 websockets 版本判断连接是否关闭"""
-        ws = self._ws
-        if ws is None:
-            return True
-
-        closed_attr = getattr(ws, "closed", None)
-        if isinstance(closed_attr, bool):
-            return closed_attr
-
-        state = getattr(ws, "state", None)
-        if state is None:
-            return False
-
+    @staticmethod
+    async def _watch_closed(ws, closed: asyncio.Event):
+        """等待连接关闭并置位事件，发送循环只需检查事件，不必每轮查询连接状态"""
         try:
-            return str(state).upper().endswith("CLOSED")
-        except Exception:
-            return False
+            await ws.wait_closed()
+        finally:
+            closed.set()